@@ -17,20 +17,34 @@ def is_raspberry_pi_os():
     return os.path.exists('/etc/rpi-issue')
 
 def set_hdmi_power(on):
-    """Turn slideshow HDMI output (HDMI1) on or off, leave console HDMI (HDMI0) always on."""
+    """Turn slideshow HDMI output (HDMI1) on or off, leave console HDMI (HDMI0) always on.
+    Returns True if the state was applied."""
     if is_raspberry_pi_os():
         # Control only HDMI1 (slideshow display), leave HDMI0 (console) always on
-        cmd = "vcgencmd display_power {} 2".format(1 if on else 0)
-        subprocess.run(cmd, shell=True)
+        try:
+            result = subprocess.run(['vcgencmd', 'display_power', '1' if on else '0', '2'])
+        except OSError as e:
+            print(f"Failed to run vcgencmd: {e}")
+            return False
+        return result.returncode == 0
     else:
         # On non-Pi systems (like Ubuntu), log the action but don't attempt vcgencmd
         action = "on" if on else "off"
         print(f"Would turn slideshow HDMI {action} (vcgencmd not available on this OS)")
+        return True
+
+# Re-send the state this often even when it has not changed, in case something else switched HDMI
+reapply_interval = 10 * 60
 
 # Main loop
+hdmi_on = None  # Last state applied successfully; None retries on the next check
+last_applied = 0
 while True:
-    if is_active_time():
-        set_hdmi_power(True)  # HDMI on during active hours
-    else:
-        set_hdmi_power(False)  # HDMI off outside active hours
+    active = is_active_time()  # HDMI on during active hours, off outside them
+    if active != hdmi_on or time.monotonic() - last_applied >= reapply_interval:
+        if set_hdmi_power(active):
+            hdmi_on = active
+            last_applied = time.monotonic()
+        else:
+            hdmi_on = None
     time.sleep(60)  # Check every minute
\ No newline at end of file
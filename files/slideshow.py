@@ -15,17 +15,26 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import hashlib
+import base64
 import os
+import fcntl
+import re
+import struct
+import shutil
+import stat
 import tempfile
 import sys
 import signal
 from PIL import Image
-from queue import Queue
+from queue import Queue, Empty, Full
+from collections import OrderedDict
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from contextlib import contextmanager
 import subprocess
 import atexit
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Set up basic logging early for display setup debugging
 import logging
@@ -39,6 +48,15 @@ def signal_handler(signum, frame):
 
 signal.signal(signal.SIGHUP, signal_handler)
 
+# Stop the main loop on systemd stop so it can join its threads before atexit cleanup runs;
+# raising SystemExit here could land anywhere in the frame loop
+shutdown_requested = threading.Event()
+
+def terminate_handler(signum, frame):
+    shutdown_requested.set()
+
+signal.signal(signal.SIGTERM, terminate_handler)
+
 # Detect if running on Ubuntu (needs Xvfb) vs Raspberry Pi OS (can use fbcon)
 def is_ubuntu():
     """Check if running on Ubuntu."""
@@ -54,27 +72,73 @@ def is_ubuntu():
 # Global variable for Xvfb process
 xvfb_proc = None
 
+# Function to probe a device node with a single stat call
+def probe_device(path):
+    """Return (readable, writable) for the current user from one os.stat, or None if the path is missing"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    euid = os.geteuid()
+    if euid == 0:
+        return True, True
+    if st.st_uid == euid:
+        read_bit, write_bit = stat.S_IRUSR, stat.S_IWUSR
+    elif st.st_gid == os.getegid() or st.st_gid in os.getgroups():
+        read_bit, write_bit = stat.S_IRGRP, stat.S_IWGRP
+    else:
+        read_bit, write_bit = stat.S_IROTH, stat.S_IWOTH
+    return bool(st.st_mode & read_bit), bool(st.st_mode & write_bit)
+
 # Function to check if framebuffer exists and is accessible
 def check_framebuffer(fb_path):
     """Check if framebuffer device exists and is accessible"""
     try:
-        exists = os.path.exists(fb_path)
-        accessible = os.access(fb_path, os.R_OK | os.W_OK) if exists else False
+        access = probe_device(fb_path)
+        exists = access is not None
+        accessible = exists and all(access)
         early_logger.info(f"Framebuffer {fb_path}: exists={exists}, accessible={accessible}")
         return exists and accessible
     except Exception as e:
         early_logger.error(f"Error checking framebuffer {fb_path}: {e}")
         return False
 
+FBSET_TIMEOUT = 1  # Seconds to wait for fbset per framebuffer
+# fbset "geometry <xres> <yres> <vxres> <vyres> <depth>" line
+FBSET_GEOMETRY_RE = re.compile(r'^\s*geometry\s+(\d+)\s+(\d+)\s+\d+\s+\d+\s+(\d+)', re.M)
+
+FBIOGET_VSCREENINFO = 0x4600  # linux/fb.h
+FB_VAR_SCREENINFO_SIZE = 160  # sizeof(struct fb_var_screeninfo)
+
+# Function to read framebuffer geometry directly from the kernel
+def read_framebuffer_geometry(fb_path):
+    """Return (xres, yres, bits_per_pixel) via the FBIOGET_VSCREENINFO ioctl, or None on failure"""
+    try:
+        fd = os.open(fb_path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        info = bytearray(FB_VAR_SCREENINFO_SIZE)
+        fcntl.ioctl(fd, FBIOGET_VSCREENINFO, info)
+        # xres, yres, xres_virtual, yres_virtual, xoffset, yoffset, bits_per_pixel
+        xres, yres, _, _, _, _, bpp = struct.unpack_from('=7I', info)
+        return xres, yres, bpp
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
 # Function to setup framebuffer permissions and devices
 def setup_framebuffer_ubuntu():
     """Setup framebuffer devices and permissions for Ubuntu"""
     try:
         import subprocess
         # Ensure framebuffer devices exist and have proper permissions
+        fb_paths = []
         for fb_num in [0, 1]:
             fb_path = f'/dev/fb{fb_num}'
-            if not os.path.exists(fb_path):
+            exists = probe_device(fb_path) is not None
+            if not exists:
                 early_logger.info(f"Creating framebuffer device {fb_path}")
                 try:
                     # Create framebuffer device node
@@ -85,21 +149,46 @@ def setup_framebuffer_ubuntu():
                     subprocess.run(['sudo', 'chmod', '664', fb_path], 
                                  check=True, capture_output=True)
                     early_logger.info(f"Successfully created {fb_path}")
+                    exists = True
                 except subprocess.CalledProcessError as e:
                     early_logger.warning(f"Failed to create {fb_path}: {e}")
             
-            # Check if framebuffer is now accessible
-            if os.path.exists(fb_path):
+            if exists:
+                fb_paths.append(fb_path)
+        
+        # Ask the kernel directly; only fall back to (sudo) fbset for devices we cannot open
+        unresolved = []
+        for fb_path in fb_paths:
+            geometry = read_framebuffer_geometry(fb_path)
+            if geometry:
+                early_logger.info(f"Framebuffer {fb_path} resolution: {geometry[0]}x{geometry[1]}x{geometry[2]}")
+            else:
+                unresolved.append(fb_path)
+        fb_paths = unresolved
+        
+        # Query remaining framebuffers at once; fbset answers immediately or not at all
+        if fb_paths and shutil.which('fbset'):
+            fbset_procs = [(fb_path, subprocess.Popen(['sudo', 'fbset', '-fb', fb_path],
+                                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True))
+                           for fb_path in fb_paths]
+            for fb_path, proc in fbset_procs:
                 try:
-                    # Try to get framebuffer info
-                    result = subprocess.run(['sudo', 'fbset', '-fb', fb_path], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        early_logger.info(f"Framebuffer {fb_path} info: {result.stdout.strip()}")
+                    stdout, stderr = proc.communicate(timeout=FBSET_TIMEOUT)
+                    if proc.returncode == 0:
+                        geometry = FBSET_GEOMETRY_RE.search(stdout)
+                        if geometry:
+                            width, height, bpp = map(int, geometry.groups())
+                            early_logger.info(f"Framebuffer {fb_path} resolution: {width}x{height}x{bpp}")
+                        else:
+                            early_logger.info(f"Framebuffer {fb_path} info: {stdout.strip()}")
                     else:
-                        early_logger.warning(f"Could not get {fb_path} info: {result.stderr}")
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                        early_logger.warning(f"Could not get {fb_path} info: {stderr}")
+                except subprocess.TimeoutExpired as e:
+                    proc.kill()
+                    proc.communicate()
                     early_logger.warning(f"fbset failed for {fb_path}: {e}")
+        elif fb_paths:
+            early_logger.info("fbset not installed; skipping framebuffer info")
                     
         return True
     except Exception as e:
@@ -143,7 +232,7 @@ if is_ubuntu():
                 test_env = os.environ.copy()
                 test_env['SDL_VIDEODRIVER'] = 'kmsdrm'
                 result = subprocess.run(['python3', '-c', 
-                    'import pygame; pygame.init(); pygame.display.set_mode((100,100))'], 
+                    'import pygame; pygame.display.init(); pygame.display.set_mode((100,100))'], 
                     env=test_env, capture_output=True, timeout=10)
                 if result.returncode != 0:
                     early_logger.warning(f"KMS DRM test failed: {result.stderr.decode()}")
@@ -196,6 +285,18 @@ except configparser.NoOptionError as e:
 # Read optional settings
 office_start_time_str = config.get('settings', 'office_start_time', fallback=None)
 office_end_time_str = config.get('settings', 'office_end_time', fallback=None)
+# How long the startup test pattern stays on screen; raise it to eyeball a new display
+try:
+    display_test_seconds = config.getfloat('settings', 'display_test_seconds', fallback=0.05)
+except ValueError:
+    logging.warning("Invalid display_test_seconds in configuration, using 0.05")
+    display_test_seconds = 0.05
+# How old an on-disk website screenshot from an earlier run may be before Chrome recaptures it at startup
+try:
+    website_cache_max_age = config.getfloat('settings', 'website_cache_max_age', fallback=3600)
+except ValueError:
+    logging.warning("Invalid website_cache_max_age in configuration, using 3600")
+    website_cache_max_age = 3600
 
 # Set up logging (update the early logger configuration)
 logging.basicConfig(level=logging.INFO,
@@ -215,6 +316,12 @@ try:
 except:
     early_logger.warning("Could not get pygame video driver name")
 
+# Debug smoothscale backend (slides and video frames are resized with cv2, see scale_surface)
+try:
+    early_logger.info(f"Pygame smoothscale backend: {pygame.transform.get_smoothscale_backend()}")
+except Exception:
+    early_logger.warning("Could not get pygame smoothscale backend")
+
 # Debug available video drivers
 try:
     drivers = pygame.display.list_drivers()
@@ -287,6 +394,21 @@ screen = None
 screen_width, screen_height = 1920, 1080
 successful_driver = None
 
+# Helper function for safe display updates
+def safe_display_flip(rects=None):
+    """Safely update display (only rects when given), handling dummy mode gracefully"""
+    try:
+        if successful_driver != 'dummy':
+            if rects:
+                pygame.display.update(rects)
+            else:
+                pygame.display.flip()
+        else:
+            # In dummy mode, just sleep briefly to simulate display update
+            time.sleep(0.01)
+    except Exception as e:
+        logger.warning(f"Display flip failed: {e}")
+
 for attempt, config in enumerate(display_drivers_to_try):
     driver = config['driver']
     fbdev = config['fbdev']
@@ -330,9 +452,9 @@ for attempt, config in enumerate(display_drivers_to_try):
         pass
     
     try:
-        # Reinitialize pygame with new driver
-        pygame.quit()
-        pygame.init()
+        # Restart only the display subsystem so SDL picks up the new driver
+        pygame.display.quit()
+        pygame.display.init()
         
         early_logger.info(f"Attempting to create display with {driver}...")
         screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
@@ -340,13 +462,12 @@ for attempt, config in enumerate(display_drivers_to_try):
         early_logger.info(f"SUCCESS! Created display: {screen_width}x{screen_height} using {driver}")
         successful_driver = driver
         
-        # Test display briefly
+        # Test display briefly; one flip proves the driver works, and the
+        # connecting screen that follows clears the green frame
         early_logger.info("Testing display output...")
         screen.fill((0, 255, 0))  # Green for success
         safe_display_flip()
-        time.sleep(1)
-        screen.fill((0, 0, 0))    # Black
-        safe_display_flip()
+        time.sleep(display_test_seconds)
         early_logger.info(f"Display test completed successfully with {driver}")
         
         break  # Success! Exit the retry loop
@@ -378,8 +499,8 @@ if screen is None:
     early_logger.info("Attempting final fallback with dummy driver for debugging...")
     try:
         os.environ['SDL_VIDEODRIVER'] = 'dummy'
-        pygame.quit()
-        pygame.init()
+        pygame.display.quit()
+        pygame.display.init()
         screen = pygame.display.set_mode((1920, 1080))
         screen_width, screen_height = 1920, 1080
         early_logger.warning("Running in DUMMY MODE - no display output will be visible!")
@@ -395,23 +516,40 @@ else:
     early_logger.info(f"Final SDL_FBDEV: {os.environ.get('SDL_FBDEV', 'not set')}")
     early_logger.info(f"Final DISPLAY: {os.environ.get('DISPLAY', 'not set')}")
 
-# Helper function for safe display updates
-def safe_display_flip():
-    """Safely update display, handling dummy mode gracefully"""
-    try:
-        if successful_driver != 'dummy':
-            safe_display_flip()
-        else:
-            # In dummy mode, just sleep briefly to simulate display update
-            time.sleep(0.01)
-    except Exception as e:
-        logger.warning(f"Display flip failed: {e}")
-
 # State variables
 state = "connecting"
 slides = []
 need_refetch = threading.Event()
-website_cache = {}  # Cache for website screenshots
+need_refetch.set()  # First fetch happens on slide_refresh_worker while "connecting" is shown
+refreshed_slides = Queue(maxsize=1)  # (doc, downloads) from slide_refresh_worker; doc is None when the fetch failed
+last_status_rev = {}  # Revision returned by the last status PUT, keyed by status doc id
+slideshow_doc_rev = None  # Last known _rev of this TV's slideshow document (from fetches and uploads)
+slideshow_doc_rev_lock = threading.Lock()  # Guards slideshow_doc_rev across the main, refresh and upload threads
+HTTP_POOL_SIZE = 16  # Keep-alive connections per host in the shared CouchDB session
+# Function to build a pooled HTTP session for CouchDB
+def build_http_session(pool_size=HTTP_POOL_SIZE):
+    """Create a requests session with retries and a keep-alive pool of the given size"""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+http_session = build_http_session()  # Shared by all CouchDB requests so connections stay alive
+website_cache = OrderedDict()  # Website screenshot JPEGs by URL; older entries keep only their attachment name
+website_cache_lock = threading.Lock()  # website_cache is shared by the capture, refresh and upload threads
+upload_executor = ThreadPoolExecutor(max_workers=1)  # Serialises screenshot uploads off the capture path
+atexit.register(upload_executor.shutdown, wait=True)  # Let queued uploads finish before exiting
+WEBSITE_MEMORY_CACHE_ENTRIES = 4  # Screenshot JPEGs kept in RAM; the rest reload from WEBSITE_CACHE_DIR
+ATTACHMENT_FETCH_WORKERS = 4  # Concurrent attachment downloads when a document is processed
+WEBSITE_CACHE_DIR = '/var/cache/slideshow/screenshots'  # Screenshots kept across restarts
+WEBSITE_CACHE_MAX_BYTES = 100 * 1024 * 1024  # Disk budget for cached screenshots
+ATTACHMENT_CACHE_DIR = '/var/cache/slideshow/attachments'  # Attachment bytes revalidated by ETag
+ATTACHMENT_CACHE_MAX_BYTES = 500 * 1024 * 1024  # Disk budget for cached attachments
+WEBSITE_SCREENSHOT_QUALITY = 85  # JPEG quality for website screenshots
+# cv2.imdecode flags that have libjpeg scale the DCT down while decoding
+JPEG_REDUCED_DECODE_FLAGS = {2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
 capture_queue = Queue(maxsize=1)  # Queue for single webpage capture
 capture_lock = threading.Lock()
 capture_in_progress = False  # Flag to track ongoing capture
@@ -419,17 +557,108 @@ current_slide_index = 0  # Track current slide index
 cleanup_lock = threading.Lock()  # Lock for attachment cleanup
 
 # Text rendering cache for performance optimization
-text_cache = {}  # Cache for rendered text surfaces
-last_datetime_minute = None  # Track last rendered datetime minute
+TEXT_CACHE_MAX_SIZE = 50  # Rendered text surfaces kept by render_text_surface (LRU)
+CLOCK_TEXT_CACHE_SIZE = 4  # Current-minute {datetime} overlays kept by render_clock_text_surface
+# Premultiplied text blits skip the per-pixel colour*alpha multiply (pygame >= 2.1.4)
+PREMULTIPLIED_TEXT = hasattr(pygame.Surface, 'premul_alpha') and hasattr(pygame, 'BLEND_PREMULTIPLIED')
 
 # Scrolling performance variables
 scroll_speed_pixels_per_second = 100  # Configurable scroll speed
-last_frame_time = 0  # Track frame timing for smooth scrolling
+FRAME_PERIOD_NS = 1_000_000_000 // 30  # Target 30 FPS for video and scrolling loops
+next_frame_ns = 0  # Monotonic deadline of the next frame for steady pacing
 scroll_pause_duration = 1.0  # Pause duration between scroll cycles (seconds)
 
+# Function to sleep until the next frame deadline
+def pace_frame():
+    """Sleep until the next frame deadline so display loops run at a steady rate without drift"""
+    global next_frame_ns
+    now_ns = time.monotonic_ns()
+    if now_ns - next_frame_ns > FRAME_PERIOD_NS:
+        # First frame, or fell more than a frame behind: restart the metronome instead of bursting
+        next_frame_ns = now_ns
+    next_frame_ns += FRAME_PERIOD_NS
+    time.sleep(max(0, next_frame_ns - now_ns) / 1e9)
+
+# Function to calculate scaled size and centering offsets for content
+@lru_cache(maxsize=16)
+def calculate_fit_geometry(src_width, src_height, dst_width, dst_height):
+    """Return (new_width, new_height, offset_x, offset_y) fitting source inside destination"""
+    scale_ratio = min(dst_width / src_width, dst_height / src_height)
+    new_width = int(src_width * scale_ratio)
+    new_height = int(src_height * scale_ratio)
+    return new_width, new_height, (dst_width - new_width) // 2, (dst_height - new_height) // 2
+
+# Function to match a surface to the display pixel format
+def to_display_format(surface):
+    """Convert surface to the display pixel format so per-frame blits skip conversion"""
+    try:
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+    except pygame.error as e:
+        logger.warning(f"Could not convert surface to display format: {e}")
+        return surface
+
+# Function to scale a surface for display
+def scale_surface(surface, size):
+    """Scale a surface with OpenCV, using area interpolation for downscales and Lanczos for upscales"""
+    src_width, src_height = surface.get_size()
+    if (src_width, src_height) == size:
+        return surface
+    upscale = size[0] >= src_width or size[1] >= src_height
+    # cv2.resize is SIMD-optimised on ARM, where pygame's smoothscale falls back to generic C
+    pixel_format = 'RGBA' if surface.get_flags() & pygame.SRCALPHA else 'RGB'
+    pixels = np.frombuffer(pygame.image.tostring(surface, pixel_format), dtype=np.uint8)
+    pixels = pixels.reshape(src_height, src_width, len(pixel_format))
+    scaled = cv2.resize(pixels, size, interpolation=cv2.INTER_LANCZOS4 if upscale else cv2.INTER_AREA)
+    return pygame.image.frombuffer(scaled, size, pixel_format)
+
+# Function to read a JPEG's dimensions from its frame header
+def jpeg_dimensions(data):
+    """Return (width, height) from the first SOF marker of JPEG data, or None if it is not a JPEG"""
+    if data[:2] != b'\xff\xd8':
+        return None
+    offset = 2
+    while offset + 9 <= len(data):
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        segment_length = struct.unpack_from('>H', data, offset + 2)[0]
+        # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack_from('>HH', data, offset + 5)
+            return width, height
+        offset += 2 + segment_length
+    return None
+
+# Function to decode an image attachment close to its display size
+def load_image_attachment(content_data, content_name):
+    """Decode image bytes, letting libjpeg downscale large JPEGs by 2/4/8 during decode"""
+    dimensions = jpeg_dimensions(content_data)
+    if dimensions and all(dimensions):
+        img_width, img_height = dimensions
+        new_width, new_height, _, _ = calculate_fit_geometry(img_width, img_height, screen_width, screen_height)
+        reduction = min(img_width // max(new_width, 1), img_height // max(new_height, 1))
+        for factor in (8, 4, 2):
+            if reduction >= factor:
+                # Orientation is ignored to match pygame.image.load, which does not apply EXIF rotation
+                flags = JPEG_REDUCED_DECODE_FLAGS[factor] | cv2.IMREAD_IGNORE_ORIENTATION
+                frame = cv2.imdecode(np.frombuffer(content_data, dtype=np.uint8), flags)
+                if frame is not None:
+                    frame_height, frame_width = frame.shape[:2]
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    return pygame.image.frombuffer(frame, (frame_width, frame_height), 'RGB')
+                break
+    # BytesIO shares the downloaded bytes rather than copying them; the
+    # name hint lets SDL_image pick the decoder without probing every format
+    return pygame.image.load(BytesIO(content_data), content_name)
+
 # Function to capture website screenshot
 def capture_website(url, timeout=20):
-    """Capture website screenshot and return pygame surface"""
+    """Capture a 1920x1080 website screenshot and return it as JPEG bytes, or None; no pygame work, so any thread"""
     driver = None
     try:
         # Setup headless Chrome
@@ -461,7 +690,7 @@ def capture_website(url, timeout=20):
             logger.error("  Ubuntu/Debian: sudo apt install chromium-browser chromium-chromedriver python3-selenium")
             logger.error("  RHEL/CentOS: sudo dnf install chromium chromedriver python3-selenium")
             logger.error("  Or install via pip: pip install selenium")
-            return None, None
+            return None
 
         # Set timeouts
         driver.set_page_load_timeout(timeout)
@@ -476,7 +705,7 @@ def capture_website(url, timeout=20):
             driver.get(url)
         except Exception as nav_error:
             logger.error(f"Navigation failed for {url}: {nav_error}")
-            return None, None
+            return None
         
         # Wait for page to load
         try:
@@ -529,11 +758,21 @@ def capture_website(url, timeout=20):
             
             # Set window height to capture full page
             driver.set_window_size(1920, total_height)
-            screenshot_data = driver.get_screenshot_as_png()
+            try:
+                # Let Chrome encode only the 1920x1080 slide area, as JPEG, instead of a full-page PNG
+                result = driver.execute_cdp_cmd('Page.captureScreenshot', {
+                    'format': 'jpeg',
+                    'quality': WEBSITE_SCREENSHOT_QUALITY,
+                    'clip': {'x': 0, 'y': 0, 'width': 1920, 'height': 1080, 'scale': 1},
+                })
+                screenshot_data = base64.b64decode(result['data'])
+            except Exception as cdp_error:
+                logger.warning(f"DevTools screenshot failed for {url}, falling back to PNG: {cdp_error}")
+                screenshot_data = driver.get_screenshot_as_png()
             logger.debug(f"Screenshot captured successfully: ({len(screenshot_data)} bytes)")
         except Exception as screenshot_error:
             logger.error(f"Failed to take screenshot for {url}: {screenshot_error}")
-            return None, None
+            return None
         finally:
             if driver:
                 try:
@@ -543,7 +782,7 @@ def capture_website(url, timeout=20):
 
         if not screenshot_data:
             logger.error(f"No screenshot data captured for {url}")
-            return None, None
+            return None
 
         # Process screenshot to 1920x1080
         image = Image.open(BytesIO(screenshot_data))
@@ -560,31 +799,19 @@ def capture_website(url, timeout=20):
             # Crop to 1920x1080 from top
             image = image.crop((0, 0, 1920, 1080))
         
-        # Save to BytesIO for pygame
-        output = BytesIO()
-        image.save(output, format='PNG')
-        screenshot_data = output.getvalue()
-        output.close()
-
-        # Convert to pygame surface
-        image_data = BytesIO(screenshot_data)
-        image_surface = pygame.image.load(image_data)
+        # Re-encode only if needed; an exact 1920x1080 JPEG capture keeps its original bytes
+        if image.size != (img_width, img_height) or image.format != 'JPEG':
+            with BytesIO() as output:
+                image.convert('RGB').save(output, format='JPEG', quality=WEBSITE_SCREENSHOT_QUALITY)
+                screenshot_data = output.getvalue()
 
         # Verify resolution
-        img_width, img_height = image_surface.get_size()
-        if (img_width, img_height) != (1920, 1080):
-            logger.error(f"Screenshot processed to {img_width}x{img_height}, expected 1920x1080")
-            return None, None
-
-        # Scale to fit screen
-        width_ratio = screen_width / img_width
-        height_ratio = screen_height / img_height
-        scale_ratio = min(width_ratio, height_ratio)
-        new_width = int(img_width * scale_ratio)
-        new_height = int(img_height * scale_ratio)
-        scaled_image = pygame.transform.smoothscale(image_surface, (new_width, new_height))
+        if image.size != (1920, 1080):
+            logger.error(f"Screenshot processed to {image.size[0]}x{image.size[1]}, expected 1920x1080")
+            return None
 
-        return scaled_image, screenshot_data
+        # The JPEG is decoded into a surface on the main thread when the slide is built
+        return screenshot_data
 
     except Exception as e:
         logger.error(f"Error capturing website {url}: {e}")
@@ -593,38 +820,239 @@ def capture_website(url, timeout=20):
                 driver.quit()
             except Exception as cleanup_error:
                 logger.warning(f"Driver cleanup failed during exception handling: {cleanup_error}")
-        return None, None
+        return None
+
+# Function to name the CouchDB attachment for a website screenshot
+def website_screenshot_name(url):
+    """Return a new attachment name for a screenshot of url"""
+    url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+    return f"website_{int(time.time())}_{url_hash}.jpg"
+
+# Function to upload a website screenshot without waiting for CouchDB
+def queue_website_upload(url, screenshot_data, captured_at):
+    """Hand the upload to the background uploader; the attachment name is recorded only once CouchDB has stored it"""
+    filename = website_screenshot_name(url)
+    def record_if_uploaded(upload):
+        if not upload.cancelled() and upload.result():
+            record_website_upload(url, captured_at, filename)
+    upload_executor.submit(upload_website_screenshot, url, screenshot_data, filename).add_done_callback(record_if_uploaded)
 
 # Function to upload website screenshot to CouchDB
-def upload_website_screenshot(url, screenshot_data):
-    """Upload website screenshot to CouchDB and return attachment name"""
+def upload_website_screenshot(url, screenshot_data, filename):
+    """Upload website screenshot to CouchDB under the given attachment name; returns the name or None"""
+    global slideshow_doc_rev
     try:
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-        timestamp = int(time.time())
-        filename = f"website_{timestamp}_{url_hash}.png"
         upload_url = f"{couchdb_url}/slideshows/{tv_uuid}/{filename}"
-        
-        doc_response = requests.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=5)
-        if doc_response.status_code == 200:
-            current_rev = doc_response.json().get('_rev')
-            upload_url += f"?rev={current_rev}"
-            response = requests.put(upload_url, 
+        for attempt in range(2):
+            # Use the last known revision and only GET the document when it is unknown or stale
+            with slideshow_doc_rev_lock:
+                current_rev = slideshow_doc_rev
+            if current_rev is None:
+                doc_response = http_session.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=5)
+                if doc_response.status_code != 200:
+                    logger.error(f"Failed to get document revision for website upload")
+                    return None
+                current_rev = doc_response.json().get('_rev')
+            response = http_session.put(upload_url,
+                                  params={'rev': current_rev},
                                   data=screenshot_data,
-                                  headers={'Content-Type': 'image/png'},
+                                  headers={'Content-Type': 'image/jpeg'},
                                   timeout=10)
-            if response.status_code in [200, 201]:
-                logger.info(f"Successfully uploaded website screenshot: {filename}")
-                return filename
-            else:
-                logger.error(f"Failed to upload website screenshot: {response.status_code}")
-                return None
+            if response.status_code != 409 or attempt:
+                break
+            logger.debug("Slideshow document revision changed, refreshing before upload retry")
+            with slideshow_doc_rev_lock:
+                slideshow_doc_rev = None
+        if response.status_code in [200, 201]:
+            with slideshow_doc_rev_lock:
+                slideshow_doc_rev = response.json().get('rev')
+            logger.info(f"Successfully uploaded website screenshot: {filename}")
+            return filename
         else:
-            logger.error(f"Failed to get document revision for website upload")
+            with slideshow_doc_rev_lock:
+                slideshow_doc_rev = None
+            logger.error(f"Failed to upload website screenshot: {response.status_code}")
             return None
     except Exception as e:
         logger.error(f"Error uploading website screenshot: {e}")
         return None
 
+# Function to get the on-disk cache path for a website screenshot
+def website_cache_path(url):
+    """Return the screenshot cache file for a URL (the uploaded attachment name sits beside it)"""
+    return os.path.join(WEBSITE_CACHE_DIR, hashlib.blake2b(url.encode(), digest_size=16).hexdigest() + '.jpg')
+
+# Function to keep a screenshot's JPEG in memory
+def remember_website_capture(url, screenshot_data, filename, captured_at):
+    """Record a screenshot in website_cache, dropping the JPEGs of the least recently used URLs"""
+    with website_cache_lock:
+        cached = website_cache.get(url)
+        if cached and cached['timestamp'] == captured_at:
+            # Reloaded copy of the same capture: keep the name its upload may have recorded meanwhile
+            cached['data'] = screenshot_data
+        else:
+            website_cache[url] = {
+                'data': screenshot_data,
+                'filename': filename,
+                'timestamp': captured_at
+            }
+        website_cache.move_to_end(url)
+        # website_cache is kept in least-recently-used order, so no sort is needed to find the oldest
+        in_memory = [cached_url for cached_url, entry in website_cache.items() if entry['data'] is not None]
+        for cached_url in in_memory[:-WEBSITE_MEMORY_CACHE_ENTRIES]:
+            # Keep the filename so the attachment stays referenced; the JPEG on disk can be reloaded
+            website_cache[cached_url]['data'] = None
+
+# Function to look up the latest screenshot of a URL
+def cached_website_capture(url):
+    """Return (JPEG bytes, attachment name) from memory or disk, or None when Chrome has to capture the URL"""
+    with website_cache_lock:
+        cached = website_cache.get(url)
+        if cached:
+            website_cache.move_to_end(url)
+            if cached['data'] is not None:
+                return cached['data'], cached['filename']
+    # Captured earlier in this run but evicted from memory: the disk copy is the latest capture whatever its age.
+    # Otherwise only trust a disk copy from an earlier run while it is younger than website_cache_max_age.
+    disk_capture = read_website_screenshot(url, None if cached else website_cache_max_age)
+    if disk_capture:
+        # Back in memory, and its attachment name referenced so cleanup keeps it
+        remember_website_capture(url, *disk_capture, cached['timestamp'] if cached else time.time())
+    return disk_capture
+
+# Function to record a new website capture in memory and on disk
+def store_website_capture(url, screenshot_data):
+    """Cache a capture for this run and persist its JPEG so restarts can skip Chrome; returns its capture time"""
+    captured_at = time.time()
+    # No attachment name until the upload succeeds (record_website_upload)
+    remember_website_capture(url, screenshot_data, None, captured_at)
+    path = website_cache_path(url)
+    try:
+        os.makedirs(WEBSITE_CACHE_DIR, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(screenshot_data)
+        os.replace(temp_path, path)
+        try:
+            # The previous capture's name no longer describes this JPEG
+            os.unlink(path + '.name')
+        except FileNotFoundError:
+            pass
+        prune_disk_cache(WEBSITE_CACHE_DIR, '.jpg', '.name', WEBSITE_CACHE_MAX_BYTES)
+    except OSError as e:
+        logger.warning(f"Could not store website screenshot on disk for {url}: {e}")
+    return captured_at
+
+# Function to attach an uploaded screenshot's name to its capture
+def record_website_upload(url, captured_at, filename):
+    """Record the attachment name in website_cache and the .name sidecar, unless a newer capture replaced it"""
+    with website_cache_lock:
+        cached = website_cache.get(url)
+        if not cached or cached['timestamp'] != captured_at:
+            return
+        cached['filename'] = filename
+        try:
+            with open(website_cache_path(url) + '.name', 'w') as f:
+                f.write(filename)
+        except OSError as e:
+            logger.warning(f"Could not record website screenshot name for {url}: {e}")
+
+# Function to keep an on-disk cache directory under its size budget
+def prune_disk_cache(cache_dir, data_suffix, sidecar_suffix, max_bytes):
+    """Delete the oldest cached files (and their sidecars) until the directory fits max_bytes"""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(data_suffix):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        for stale_path in (path, path + sidecar_suffix):
+            try:
+                os.unlink(stale_path)
+            except FileNotFoundError:
+                pass
+        total_bytes -= size
+        logger.info(f"Evicted cached file {path}")
+
+# Function to read a website screenshot from disk
+def read_website_screenshot(url, max_age=None):
+    """Return (JPEG bytes, attachment name or None) for the cached capture of url, if any and newer than max_age seconds"""
+    path = website_cache_path(url)
+    try:
+        if max_age is not None and time.time() - os.stat(path).st_mtime > max_age:
+            return None
+        with open(path, 'rb') as f:
+            screenshot_data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not read cached website screenshot {path}: {e}")
+        return None
+    try:
+        with open(path + '.name', 'r') as f:
+            filename = f.read().strip() or None
+    except OSError:
+        filename = None
+    return screenshot_data, filename
+
+# Function to get a website slide's screenshot for a document refresh
+def fetch_website_screenshot(url):
+    """Return (JPEG bytes, attachment name) from the cache, capturing the page with Chrome when there is none"""
+    cached = cached_website_capture(url)
+    if cached:
+        logger.info(f"Using cached website screenshot: {url}")
+        return cached
+    logger.info(f"Capturing fresh website screenshot: {url}")
+    screenshot_data = capture_website(url, timeout=20)
+    if screenshot_data:
+        queue_website_upload(url, screenshot_data, store_website_capture(url, screenshot_data))
+        # The slide shows under its own name until the upload has succeeded
+        return screenshot_data, None
+    # Fall back to a capture the background worker stored meanwhile
+    cached = cached_website_capture(url)
+    if cached:
+        logger.warning(f"Using previous cached screenshot due to capture failure: {url}")
+    return cached
+
+# Pi hardware H.264 decode; caps negotiation fails on other codecs so open_video_capture falls back
+GSTREAMER_H264_PIPELINE = ('filesrc location="{path}" ! qtdemux ! h264parse ! v4l2h264dec ! '
+                           'videoconvert ! video/x-raw,format=BGR ! appsink max-buffers=2')
+GSTREAMER_AVAILABLE = bool(re.search(r'GStreamer:\s*YES', cv2.getBuildInformation()))
+
+# Function to open a video capture, preferring hardware decoding
+def open_video_capture(video_path):
+    """Open video on the V4L2 H.264 decoder, FFmpeg hardware acceleration, or software decode"""
+    if GSTREAMER_AVAILABLE:
+        try:
+            cap = cv2.VideoCapture(GSTREAMER_H264_PIPELINE.format(path=video_path), cv2.CAP_GSTREAMER)
+            if cap.isOpened():
+                logger.info("Opened video with GStreamer v4l2h264dec")
+                return cap
+            cap.release()
+        except Exception as e:
+            logger.warning(f"GStreamer video open failed, trying FFmpeg: {e}")
+    if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+        try:
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG,
+                                   [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+            if cap.isOpened():
+                logger.info(f"Opened video with hardware acceleration mode {int(cap.get(cv2.CAP_PROP_HW_ACCELERATION))}")
+                return cap
+            cap.release()
+        except Exception as e:
+            logger.warning(f"Hardware accelerated video open failed, using software decode: {e}")
+    return cv2.VideoCapture(video_path)
+
+VIDEO_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes written per chunk when saving videos to disk
+
+# Per-process directory for downloaded videos; removed in one pass at exit
+video_temp_dir = tempfile.mkdtemp(prefix='raspberry-tv-')
+atexit.register(shutil.rmtree, video_temp_dir, ignore_errors=True)
+
 # Function to handle video content
 def process_video(video_name):
     """Process video file and return video capture object"""
@@ -632,27 +1060,30 @@ def process_video(video_name):
     try:
         url = f"{couchdb_url}/slideshows/{tv_uuid}/{video_name}"
         headers = {'Cache-Control': 'no-store'}
-        response = requests.get(url, headers=headers, timeout=30)
-        if response.status_code == 200:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
-            try:
-                temp_file.write(response.content)
-                temp_file_path = temp_file.name
-            finally:
-                temp_file.close()
-            
-            cap = cv2.VideoCapture(temp_file_path)
-            if cap.isOpened():
-                return cap, temp_file_path
-            else:
-                logger.error(f"Failed to open video: {video_name}")
+        # Stream the attachment to disk instead of holding the whole video in memory first
+        with http_session.get(url, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 200:
+                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4', dir=video_temp_dir)
                 try:
-                    os.unlink(temp_file_path)
-                except OSError as cleanup_error:
-                    logger.warning(f"Failed to cleanup temp file {temp_file_path}: {cleanup_error}")
+                    temp_file_path = temp_file.name
+                    # Copy from the raw stream in large reads rather than iterating chunks in Python
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, temp_file, VIDEO_DOWNLOAD_CHUNK_SIZE)
+                finally:
+                    temp_file.close()
+            else:
+                logger.error(f"HTTP error {response.status_code} fetching video {video_name}")
                 return None, None
+        
+        cap = open_video_capture(temp_file_path)
+        if cap.isOpened():
+            return cap, temp_file_path
         else:
-            logger.error(f"HTTP error {response.status_code} fetching video {video_name}")
+            logger.error(f"Failed to open video: {video_name}")
+            try:
+                os.unlink(temp_file_path)
+            except OSError as cleanup_error:
+                logger.warning(f"Failed to cleanup temp file {temp_file_path}: {cleanup_error}")
             return None, None
     except Exception as e:
         logger.error(f"Error processing video {video_name}: {e}")
@@ -687,90 +1118,210 @@ def video_resource_manager(video_cap, temp_file_path):
             except OSError as file_error:
                 logger.warning(f"Failed to cleanup temp video file {temp_file_path}: {file_error}")
 
+# Whether video surfaces wrap their numpy buffers (pygame BGR frombuffer support)
+frame_buffers_shared = True
+rgb_frame_buffer = None  # BGR->RGB conversion target when BGR buffers cannot be shared
+rgb_frame_surface = None  # Surface aliasing rgb_frame_buffer
+
+VIDEO_MAX_SKIP_FRAMES = 5  # Most frames the decode worker drops at once to catch up with the video timeline
+
+# Background worker to decode video frames ahead of display
+def video_decode_worker(video_cap, video_path, frame_queue, stop_event):
+    """Decode frames into frame_queue at the video's own frame rate, overlapping display of the previous frame"""
+    capture = video_cap
+    try:
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        frame_period = 1 / fps if fps and fps > 0 else None
+        timeline_start = time.monotonic()
+        frame_index = 0
+        while not stop_event.is_set():
+            if frame_period:
+                # Pace decoding against each frame's timestamp on the video's own timeline
+                frames_behind = int((time.monotonic() - timeline_start) / frame_period) - frame_index
+                if frames_behind < 0:
+                    # Ahead (e.g. a 24 fps clip on the 30 fps display loop): wait until this frame is due
+                    if stop_event.wait(timeline_start + frame_index * frame_period - time.monotonic()):
+                        break
+                elif frames_behind > 0:
+                    # Late frames (slow decode or display): grab() past them, skipping their colour conversion and copy
+                    for _ in range(min(frames_behind, VIDEO_MAX_SKIP_FRAMES)):
+                        if not capture.grab():
+                            break
+                        frame_index += 1
+            ret, frame = capture.read()
+            frame_index += 1
+            if not ret:
+                # Loop by reopening the file; seeking back with CAP_PROP_POS_FRAMES stalls on many codecs.
+                # The slide's own capture stays open (at EOF) and is released by its cleanup function.
+                if capture is not video_cap:
+                    capture.release()
+                capture = open_video_capture(video_path)
+                ret, frame = capture.read()
+                if not ret:
+                    logger.warning("Video decode worker could not read any frames")
+                    break
+                timeline_start = time.monotonic()
+                frame_index = 1
+            while not stop_event.is_set():
+                try:
+                    frame_queue.put(frame, timeout=0.1)
+                    break
+                except Full:
+                    continue
+    except Exception as e:
+        logger.error(f"Error in video decode worker: {e}")
+    finally:
+        if capture is not video_cap:
+            capture.release()
+        # Signal end of stream to the display loop
+        try:
+            frame_queue.put_nowait(None)
+        except Full:
+            pass
+
+# Function to start a decode worker for a video capture
+def start_video_decoder(video_cap, video_path):
+    """Start a decode worker thread and return (frame_queue, stop_event, thread)"""
+    frame_queue = Queue(maxsize=2)  # Double-buffered: one frame displayed, one decoded ahead
+    stop_event = threading.Event()
+    thread = threading.Thread(target=video_decode_worker, args=(video_cap, video_path, frame_queue, stop_event), daemon=True)
+    thread.start()
+    return frame_queue, stop_event, thread
+
+# Function to stop a decode worker before its capture is released
+def stop_video_decoder(stop_event, thread):
+    """Stop the decode worker and wait for it to finish using the capture"""
+    stop_event.set()
+    thread.join(timeout=2)
+    if thread.is_alive():
+        logger.warning("Video decode worker did not stop within 2 seconds")
+
+# Function to calculate display geometry for a video capture
+def get_video_geometry(video_cap):
+    """Return fit geometry from the capture's reported frame size, or None if unknown"""
+    try:
+        frame_width = int(video_cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        frame_height = int(video_cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    except Exception as e:
+        logger.warning(f"Could not read video frame size: {e}")
+        return None
+    if frame_width <= 0 or frame_height <= 0:
+        return None
+    return calculate_fit_geometry(frame_width, frame_height, screen_width, screen_height)
+
 # Function to convert OpenCV frame to pygame surface
 def cv2_to_pygame(cv2_frame):
-    """Convert OpenCV frame to pygame surface"""
+    """Convert OpenCV frame to pygame surface, wrapping the BGR buffer without copying when possible"""
     try:
-        rgb_frame = cv2.cvtColor(cv2_frame, cv2.COLOR_BGR2RGB)
-        rgb_frame = np.rot90(rgb_frame)
-        rgb_frame = np.flipud(rgb_frame)
-        surface = pygame.surfarray.make_surface(rgb_frame)
-        return surface
+        frame_height, frame_width = cv2_frame.shape[:2]
+        global frame_buffers_shared, rgb_frame_buffer, rgb_frame_surface
+        if frame_buffers_shared:
+            try:
+                # Zero-copy view of the frame buffer; BGR->RGB happens during the blit
+                return pygame.image.frombuffer(cv2_frame, (frame_width, frame_height), 'BGR')
+            except ValueError:
+                # Older pygame without BGR buffer support, fall back to converting
+                frame_buffers_shared = False
+        if rgb_frame_buffer is None or rgb_frame_buffer.shape != cv2_frame.shape:
+            # Persistent RGB buffer with a surface wrapping it; later frames convert into it in place
+            rgb_frame_buffer = np.empty_like(cv2_frame)
+            rgb_frame_surface = None
+        cv2.cvtColor(cv2_frame, cv2.COLOR_BGR2RGB, dst=rgb_frame_buffer)
+        if rgb_frame_surface is None:
+            rgb_frame_surface = pygame.image.frombuffer(rgb_frame_buffer, (frame_width, frame_height), 'RGB')
+        return rgb_frame_surface
     except Exception as e:
         logger.error(f"Error converting cv2 frame to pygame: {e}")
         return None
 
+# Function to locate an attachment in the on-disk cache
+def attachment_cache_path(content_name):
+    """Return the cache file for one of this TV's attachments (its ETag sits beside it)"""
+    return os.path.join(ATTACHMENT_CACHE_DIR, hashlib.blake2b(f"{tv_uuid}/{content_name}".encode(), digest_size=16).hexdigest() + '.bin')
+
+# Function to read a cached attachment and its ETag
+def read_cached_attachment(cache_path):
+    """Return (etag, bytes) for a cached attachment, or (None, None) if it is missing"""
+    try:
+        with open(cache_path + '.etag') as f:
+            etag = f.read().strip()
+        with open(cache_path, 'rb') as f:
+            return etag, f.read()
+    except OSError:
+        return None, None
+
+# Function to store a downloaded attachment in the on-disk cache
+def store_cached_attachment(cache_path, etag, content_data):
+    """Write attachment bytes atomically with their ETag, then prune the cache"""
+    try:
+        os.makedirs(ATTACHMENT_CACHE_DIR, exist_ok=True)
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(content_data)
+        os.replace(temp_path, cache_path)
+        with open(cache_path + '.etag', 'w') as f:
+            f.write(etag)
+        prune_disk_cache(ATTACHMENT_CACHE_DIR, '.bin', '.etag', ATTACHMENT_CACHE_MAX_BYTES)
+    except OSError as e:
+        logger.warning(f"Could not cache attachment {cache_path} on disk: {e}")
+
+# Function to download an attachment from the TV's CouchDB document
+def download_attachment(content_name):
+    """Return the attachment bytes, or None on HTTP or network errors"""
+    try:
+        url = f"{couchdb_url}/slideshows/{tv_uuid}/{content_name}"
+        headers = {'Cache-Control': 'no-store'}
+        cache_path = attachment_cache_path(content_name)
+        cached_etag, cached_data = read_cached_attachment(cache_path)
+        if cached_etag:
+            # CouchDB answers 304 without a body when the attachment digest is unchanged
+            headers['If-None-Match'] = cached_etag
+        response = http_session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached_data is not None:
+            logger.debug(f"Attachment {content_name} unchanged, using cached copy")
+            try:
+                os.utime(cache_path)  # Keep recently shown attachments out of the prune
+            except OSError:
+                pass
+            return cached_data
+        if response.status_code == 200:
+            etag = response.headers.get('ETag')
+            if etag:
+                store_cached_attachment(cache_path, etag, response.content)
+            return response.content
+        logger.error(f"HTTP error {response.status_code} fetching content {content_name}")
+    except Exception as e:
+        logger.error(f"Error fetching content {content_name}: {e}")
+    return None
+
 # Function to fetch and process content from CouchDB attachments
-def fetch_content(slide_doc, text_params=None):
-    """Fetch and process content (image/video/website) with text overlay"""
+def fetch_content(slide_doc, text_params=None, content_data=None, content_name=None):
+    """Decode downloaded image or website screenshot bytes into a display surface with text overlay"""
     content_type = slide_doc.get('type', 'image')
-    content_name = slide_doc.get('name')
+    content_name = content_name or slide_doc.get('name')
+    decode_name = content_name
     
     if content_type == 'website':
-        url = slide_doc.get('url')
-        if not url:
-            logger.error(f"Website slide missing URL: {slide_doc}")
+        if content_data is None:
+            logger.error(f"Failed to capture website and no cache available: {slide_doc.get('url')}")
             return None, None, None, None
-        # Check cache for pre-captured screenshot
-        if url in website_cache:
-            cached = website_cache[url]
-            image = cached['surface']
-            content_name = cached['filename']
-            logger.info(f"Using pre-captured website screenshot: {url}")
-            if text_params and text_params.get('text'):
-                text_surface, text_rect = process_text_overlay(image, text_params)
-                return image, text_surface, text_rect, content_name
-            return image, None, None, content_name
-        # Attempt fresh capture once
-        logger.info(f"Capturing fresh website screenshot: {url}")
-        surface, screenshot_data = capture_website(url, timeout=20)
-        if surface and screenshot_data:
-            filename = upload_website_screenshot(url, screenshot_data)
-            website_cache[url] = {
-                'surface': surface,
-                'filename': filename or f"website_{int(time.time())}.png",
-                'timestamp': time.time()
-            }
-            image = surface
-            content_name = filename or f"website_{int(time.time())}.png"
-        else:
-            # Fall back to previous cached image if available
-            if url in website_cache:
-                cached = website_cache[url]
-                image = cached['surface']
-                content_name = cached['filename']
-                logger.warning(f"Using previous cached screenshot due to capture failure: {url}")
-            else:
-                logger.error(f"Failed to capture website and no cache available: {url}")
-                return None, None, None, None
-        if text_params and text_params.get('text'):
-            text_surface, text_rect = process_text_overlay(image, text_params)
-            return image, text_surface, text_rect, content_name
-        return image, None, None, content_name
+        # Screenshots are always JPEG; the name is only an SDL_image format hint
+        decode_name = 'screenshot.jpg'
     elif content_type == 'video':
         logger.error(f"Video content should be handled separately: {content_name}")
         return None, None, None, None
-    else:
-        try:
-            url = f"{couchdb_url}/slideshows/{tv_uuid}/{content_name}"
-            headers = {'Cache-Control': 'no-store'}
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                image_data = BytesIO(response.content)
-                image = pygame.image.load(image_data)
-                img_width, img_height = image.get_size()
-                width_ratio = screen_width / img_width
-                height_ratio = screen_height / img_height
-                scale_ratio = min(width_ratio, height_ratio)
-                new_width = int(img_width * scale_ratio)
-                new_height = int(img_height * scale_ratio)
-                image = pygame.transform.smoothscale(image, (new_width, new_height))
-            else:
-                logger.error(f"HTTP error {response.status_code} fetching content {content_name}")
-                return None, None, None, None
-        except Exception as e:
-            logger.error(f"Error fetching content {content_name}: {e}")
+    elif content_data is None:
+        content_data = download_attachment(content_name)
+        if content_data is None:
             return None, None, None, None
+    try:
+        image = load_image_attachment(content_data, decode_name)
+        img_width, img_height = image.get_size()
+        new_width, new_height, _, _ = calculate_fit_geometry(img_width, img_height, screen_width, screen_height)
+        image = to_display_format(scale_surface(image, (new_width, new_height)))
+    except Exception as e:
+        logger.error(f"Error fetching content {content_name}: {e}")
+        return None, None, None, None
     if text_params and text_params.get('text'):
         text_surface, text_rect = process_text_overlay(image, text_params)
         return image, text_surface, text_rect, content_name
@@ -818,17 +1369,95 @@ def calculate_scroll_speed(text_width, screen_width, base_speed=100):
         return base_speed * 0.8
     return base_speed
 
+# Function to load a font once per size
+@lru_cache(maxsize=8)
+def get_font(font_size):
+    """Return the overlay font at the given size, loading the face from disk only on first use"""
+    try:
+        return pygame.font.Font("freesansbold.ttf", font_size)
+    except IOError:
+        return pygame.font.Font(None, font_size)
+
+# Text position -> (Rect anchor attribute, column, row); columns/rows are 0=padded start, 1=middle, 2=padded end
+TEXT_POSITION_ANCHORS = {
+    'top-left': ('topleft', 0, 0),
+    'top-center': ('midtop', 1, 0),
+    'top-right': ('topright', 2, 0),
+    'center-left': ('midleft', 0, 1),
+    'center': ('center', 1, 1),
+    'center-right': ('midright', 2, 1),
+    'bottom-left': ('bottomleft', 0, 2),
+    'bottom-center': ('midbottom', 1, 2),
+    'bottom-right': ('bottomright', 2, 2),
+}
+
+# Function to render a text overlay, memoized on its resolved inputs
+@lru_cache(maxsize=TEXT_CACHE_MAX_SIZE)
+def render_text_surface(text_content, text_size, text_color, text_position, text_background_color, image_size):
+    """Render text (with optional background) and its rect for an image size; all arguments are hashable"""
+    font_size_map = {"small": 24, "medium": 36, "large": 48}
+    font = get_font(font_size_map.get(text_size, 36))
+    
+    text_color_rgb = pygame.Color(text_color)
+    text_surface = font.render(text_content, True, text_color_rgb)
+    
+    # Calculate text position
+    text_rect = text_surface.get_rect()
+    img_width, img_height = image_size
+    padding = 10
+    
+    anchor, column, row = TEXT_POSITION_ANCHORS.get(text_position, TEXT_POSITION_ANCHORS['bottom-center'])
+    x_positions = (padding, img_width // 2, img_width - padding)
+    y_positions = (padding, img_height // 2, img_height - padding)
+    setattr(text_rect, anchor, (x_positions[column], y_positions[row]))
+    
+    # Apply background if specified
+    surface_to_return = text_surface
+    
+    if text_background_color and text_background_color.strip():
+        try:
+            text_bg_color_rgb = pygame.Color(text_background_color)
+            bg_padding = 5
+            # An opaque background needs no per-pixel alpha, so every later blit is a plain copy
+            surface_with_background = pygame.Surface(
+                (text_surface.get_width() + 2 * bg_padding, text_surface.get_height() + 2 * bg_padding),
+                pygame.SRCALPHA if text_bg_color_rgb.a < 255 else 0
+            )
+            surface_with_background.fill(text_bg_color_rgb)
+            surface_with_background.blit(text_surface, (bg_padding, bg_padding))
+            surface_to_return = surface_with_background
+            text_rect.x -= bg_padding
+            text_rect.y -= bg_padding
+        except ValueError as ve:
+            logger.error(f"Invalid text_background_color: {text_background_color} - {ve}")
+    
+    surface_to_return = to_display_format(surface_to_return)
+    if PREMULTIPLIED_TEXT and surface_to_return.get_flags() & pygame.SRCALPHA:
+        surface_to_return = surface_to_return.premul_alpha()
+    return surface_to_return, text_rect
+
+# Clock overlays change every minute; a separate small cache stops them evicting static captions
+render_clock_text_surface = lru_cache(maxsize=CLOCK_TEXT_CACHE_SIZE)(render_text_surface.__wrapped__)
+
+# Function to blit a text surface produced by render_text_surface
+def blit_text(target, text_surface, position):
+    """Blit a text surface, using the premultiplied blend when it was premultiplied at render time"""
+    if PREMULTIPLIED_TEXT and text_surface.get_flags() & pygame.SRCALPHA:
+        return target.blit(text_surface, position, special_flags=pygame.BLEND_PREMULTIPLIED)
+    return target.blit(text_surface, position)
+
 # Function to get cached or render text surface
-def get_cached_text_surface(image, text_params, force_refresh=False):
+def get_cached_text_surface(image, text_params):
     """Get cached text surface or render new one if needed"""
-    global last_datetime_minute, text_cache
-    
     try:
         text_content = text_params['text']
-        has_datetime = '{datetime}' in text_content
+        render = render_text_surface
+        # Resolve the clock outside the cache so each minute gets its own entry
+        if '{datetime}' in text_content:
+            text_content = text_content.replace('{datetime}', datetime.now().strftime("%Y-%m-%d %H:%M"))
+            render = render_clock_text_surface
         
-        # Generate cache key based on text parameters
-        cache_key = (
+        text_surface, text_rect = render(
             text_content,
             text_params.get('text_size', 'medium'),
             text_params.get('text_color', '#FFFFFF'),
@@ -836,93 +1465,8 @@ def get_cached_text_surface(image, text_params, force_refresh=False):
             text_params.get('text_background_color', ''),
             image.get_size()  # Include image size for positioning
         )
-        
-        # Check if we need to refresh datetime content
-        current_minute = None
-        if has_datetime:
-            current_time = datetime.now()
-            current_minute = (current_time.year, current_time.month, current_time.day, 
-                            current_time.hour, current_time.minute)
-            
-            # Force refresh if minute has changed
-            if last_datetime_minute != current_minute:
-                force_refresh = True
-                last_datetime_minute = current_minute
-        
-        # Return cached surface if available and no refresh needed
-        if not force_refresh and cache_key in text_cache:
-            cached_surface, cached_rect = text_cache[cache_key]
-            return cached_surface, cached_rect
-        
-        # Render new text surface
-        if has_datetime:
-            text_content = text_content.replace('{datetime}', datetime.now().strftime("%Y-%m-%d %H:%M"))
-        
-        font_size_map = {"small": 24, "medium": 36, "large": 48}
-        actual_font_size = font_size_map.get(text_params.get('text_size', 'medium'), 36)
-        
-        try:
-            font = pygame.font.Font("freesansbold.ttf", actual_font_size)
-        except IOError:
-            font = pygame.font.Font(None, actual_font_size)
-        
-        text_color_hex = text_params.get('text_color', '#FFFFFF')
-        text_color_rgb = pygame.Color(text_color_hex)
-        text_surface = font.render(text_content, True, text_color_rgb)
-        
-        # Calculate text position
-        text_pos_key = text_params.get('text_position', 'bottom-center')
-        text_rect = text_surface.get_rect()
-        img_width, img_height = image.get_size()
-        padding = 10
-        
-        if text_pos_key == 'top-left':
-            text_rect.topleft = (padding, padding)
-        elif text_pos_key == 'top-center':
-            text_rect.midtop = (img_width // 2, padding)
-        elif text_pos_key == 'top-right':
-            text_rect.topright = (img_width - padding, padding)
-        elif text_pos_key == 'center-left':
-            text_rect.midleft = (padding, img_height // 2)
-        elif text_pos_key == 'center':
-            text_rect.center = (img_width // 2, img_height // 2)
-        elif text_pos_key == 'center-right':
-            text_rect.midright = (img_width - padding, img_height // 2)
-        elif text_pos_key == 'bottom-left':
-            text_rect.bottomleft = (padding, img_height - padding)
-        elif text_pos_key == 'bottom-center':
-            text_rect.midbottom = (img_width // 2, img_height - padding)
-        elif text_pos_key == 'bottom-right':
-            text_rect.bottomright = (img_width - padding, img_height - padding)
-        else:
-            text_rect.midbottom = (img_width // 2, img_height - padding)
-        
-        # Apply background if specified
-        text_bg_color_hex = text_params.get('text_background_color')
-        surface_to_return = text_surface
-        
-        if text_bg_color_hex and text_bg_color_hex.strip():
-            try:
-                text_bg_color_rgb = pygame.Color(text_bg_color_hex)
-                bg_padding = 5
-                surface_with_background = pygame.Surface(
-                    (text_surface.get_width() + 2 * bg_padding, text_surface.get_height() + 2 * bg_padding),
-                    pygame.SRCALPHA
-                )
-                surface_with_background.fill(text_bg_color_rgb)
-                surface_with_background.blit(text_surface, (bg_padding, bg_padding))
-                surface_to_return = surface_with_background
-                text_rect.x -= bg_padding
-                text_rect.y -= bg_padding
-            except ValueError as ve:
-                logger.error(f"Invalid text_background_color: {text_bg_color_hex} - {ve}")
-        
-        # Cache the result (limit cache size to prevent memory issues)
-        if len(text_cache) > 50:  # Clear cache if it gets too large
-            text_cache.clear()
-        text_cache[cache_key] = (surface_to_return, text_rect)
-        
-        return surface_to_return, text_rect
+        # Rects are mutable; hand out a copy so callers cannot disturb the cached one
+        return text_surface, text_rect.copy()
         
     except Exception as e:
         logger.error(f"Error processing cached text overlay: {e}")
@@ -931,7 +1475,7 @@ def get_cached_text_surface(image, text_params, force_refresh=False):
 # Function to process text overlay (legacy support)
 def process_text_overlay(image, text_params):
     """Process text overlay for any content type (legacy wrapper)"""
-    return get_cached_text_surface(image, text_params, force_refresh=True)
+    return get_cached_text_surface(image, text_params)
 
 # Function to get referenced attachments from document
 def get_referenced_attachments(doc):
@@ -945,10 +1489,11 @@ def get_referenced_attachments(doc):
         else:
             # For website slides, use the cached filename
             url = slide.get('url')
-            if url in website_cache:
-                attachment_name = website_cache[url].get('filename')
-                if attachment_name:
-                    referenced_attachments.add(attachment_name)
+            with website_cache_lock:
+                cached = website_cache.get(url)
+                attachment_name = cached.get('filename') if cached else None
+            if attachment_name:
+                referenced_attachments.add(attachment_name)
     return referenced_attachments
 
 # Function to perform immediate cleanup (called when slides change)
@@ -959,7 +1504,7 @@ def cleanup_unused_attachments_immediate():
             logger.info("Starting immediate attachment cleanup...")
             
             # Fetch current document
-            doc_response = requests.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=10)
+            doc_response = http_session.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=10)
             if doc_response.status_code != 200:
                 logger.warning(f"Failed to fetch document for immediate cleanup: {doc_response.status_code}")
                 return
@@ -997,7 +1542,7 @@ def _delete_attachment_batch(attachment_names):
     
     try:
         # Get fresh document revision for batch
-        doc_response = requests.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=10)
+        doc_response = http_session.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=10)
         if doc_response.status_code != 200:
             logger.error(f"Failed to get document for batch deletion: {doc_response.status_code}")
             return
@@ -1010,7 +1555,7 @@ def _delete_attachment_batch(attachment_names):
         for attachment_name in attachment_names:
             try:
                 delete_url = f"{couchdb_url}/slideshows/{tv_uuid}/{attachment_name}?rev={current_rev}"
-                delete_response = requests.delete(delete_url, timeout=10)
+                delete_response = http_session.delete(delete_url, timeout=10)
                 
                 if delete_response.status_code in [200, 202]:
                     logger.info(f"Successfully deleted unused attachment: {attachment_name}")
@@ -1038,7 +1583,7 @@ def cleanup_unused_attachments():
                 logger.info("Starting periodic attachment cleanup...")
                 
                 # Fetch the current slideshow document
-                doc_response = requests.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=10)
+                doc_response = http_session.get(f"{couchdb_url}/slideshows/{tv_uuid}", timeout=10)
                 if doc_response.status_code != 200:
                     logger.error(f"Failed to fetch slideshow document for cleanup: {doc_response.status_code}")
                     time.sleep(900)  # Retry after 15 minutes
@@ -1119,14 +1664,9 @@ def website_capture_worker():
                 
                 try:
                     logger.info(f"Pre-capturing website: {url}")
-                    surface, screenshot_data = capture_website(url, timeout=15)
-                    if surface and screenshot_data:
-                        filename = upload_website_screenshot(url, screenshot_data)
-                        website_cache[url] = {
-                            'surface': surface,
-                            'filename': filename or f"website_{int(time.time())}.png",
-                            'timestamp': time.time()
-                        }
+                    screenshot_data = capture_website(url, timeout=15)
+                    if screenshot_data:
+                        queue_website_upload(url, screenshot_data, store_website_capture(url, screenshot_data))
                         logger.info(f"Successfully pre-captured website: {url}")
                     else:
                         logger.warning(f"Pre-capture failed for website: {url}")
@@ -1166,17 +1706,18 @@ def queue_website_capture(slides_list, current_index):
 
 # Function to fetch the slideshow document from CouchDB
 def fetch_document():
+    global slideshow_doc_rev
     try:
         url = f"{couchdb_url}/slideshows/{tv_uuid}"
-        session = requests.Session()
-        retries = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        session.mount('http://', HTTPAdapter(max_retries=retries))
-        response = session.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
         
         if response.status_code == 200:
             logger.info("Successfully fetched document")
             try:
-                return response.json()
+                doc = response.json()
+                with slideshow_doc_rev_lock:
+                    slideshow_doc_rev = doc.get('_rev')
+                return doc
             except json.JSONDecodeError as json_error:
                 logger.error(f"Invalid JSON in document response: {json_error}")
                 return None
@@ -1208,6 +1749,8 @@ def fetch_document():
 
 # Background thread to watch for changes in CouchDB
 def watch_changes():
+    # The continuous feed holds its connection open, so it gets its own session
+    session = build_http_session(pool_size=1)
     while True:
         try:
             url = f"{couchdb_url}/slideshows/_changes"
@@ -1216,9 +1759,6 @@ def watch_changes():
                 "heartbeat": 10000,
                 "doc_ids": json.dumps([tv_uuid])
             }
-            session = requests.Session()
-            retries = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-            session.mount('http://', HTTPAdapter(max_retries=retries))
             response = session.get(url, params=params, stream=True, timeout=30)
             for line in response.iter_lines():
                 if line:
@@ -1256,14 +1796,56 @@ def cleanup_old_slides(old_slides):
             except Exception as cleanup_error:
                 logger.warning(f"Error during slide cleanup: {cleanup_error}")
 
+# Function to start the attachment downloads for a document's slides
+def start_slide_downloads(slide_docs):
+    """Start every download and website screenshot in parallel; returns one future (None if nothing to fetch) per slide"""
+    executor = ThreadPoolExecutor(max_workers=ATTACHMENT_FETCH_WORKERS)
+    # One Chrome at a time is all a Pi can afford
+    website_executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        downloads = []
+        for slide_doc in slide_docs:
+            content_type = slide_doc.get('type', 'image')
+            if content_type != 'website' and not slide_doc.get('name'):
+                logger.error(f"Slide missing attachment name: {slide_doc}")
+                downloads.append(None)
+            elif content_type == 'video':
+                downloads.append(executor.submit(process_video, slide_doc['name']))
+            elif content_type != 'website':
+                downloads.append(executor.submit(download_attachment, slide_doc['name']))
+            elif slide_doc.get('url'):
+                downloads.append(website_executor.submit(fetch_website_screenshot, slide_doc['url']))
+            else:
+                logger.error(f"Website slide missing URL: {slide_doc}")
+                downloads.append(None)
+    finally:
+        executor.shutdown(wait=False)
+        website_executor.shutdown(wait=False)
+    return downloads
+
+# Function to release downloads that will never be turned into slides
+def discard_slide_downloads(doc, downloads):
+    """Release the video captures and temp files of a superseded document's downloads"""
+    for slide_doc, download in zip(doc.get('slides', []) if doc else [], downloads):
+        if slide_doc.get('type') == 'video' and download:
+            video_cap, temp_file = download.result()
+            if video_cap:
+                video_cap.release()
+            if temp_file:
+                try:
+                    os.unlink(temp_file)
+                except OSError as file_error:
+                    logger.warning(f"Failed to cleanup temp video file {temp_file}: {file_error}")
+
 # Function to process slides from document
-def process_slides_from_doc(doc):
-    """Process slides from document and return processed slide list"""
+def process_slides_from_doc(doc, downloads):
+    """Decode a document's downloaded slides into display surfaces; pygame work, so main thread only"""
     processed_slides = []
-    for slide_doc in doc.get('slides', []):
+    slide_docs = doc.get('slides', [])
+    for slide_doc, download in zip(slide_docs, downloads):
         content_type = slide_doc.get('type', 'image')
         if content_type == 'video':
-            video_cap, temp_file = process_video(slide_doc['name'])
+            video_cap, temp_file = download.result() if download else (None, None)
             if video_cap:
                 # Create cleanup function for this video resource
                 def cleanup_video_resources(cap=video_cap, file_path=temp_file):
@@ -1306,7 +1888,13 @@ def process_slides_from_doc(doc):
                 'text_position': slide_doc.get('text_position'),
                 'text_background_color': slide_doc.get('text_background_color', None)
             }
-            image_surface, text_surface, text_rect, content_name = fetch_content(slide_doc, text_params)
+            content_data = download.result() if download else None
+            content_name = None
+            if content_type == 'website':
+                content_data, content_name = content_data or (None, None)
+            elif content_data is None:
+                continue
+            image_surface, text_surface, text_rect, content_name = fetch_content(slide_doc, text_params, content_data, content_name)
             if image_surface:
                 processed_slides.append({
                     'type': content_type,
@@ -1323,19 +1911,61 @@ def process_slides_from_doc(doc):
                 })
     return processed_slides
 
-# Function to update TV status document in CouchDB
-def update_tv_status(couchdb_base_url, tv_doc_uuid, current_slide_info):
-    status_doc_id = f"status_{tv_doc_uuid}"
-    status_doc_url = f"{couchdb_base_url}/slideshows/{status_doc_id}"
-    current_rev = None
+# Function to rebuild the slide list whenever the document changes
+def slide_refresh_worker():
+    """Fetch the changed document and its attachments off the display loop, handing (doc, downloads) over via refreshed_slides"""
+    while True:
+        need_refetch.wait()
+        need_refetch.clear()
+        try:
+            doc = fetch_document()
+            downloads = start_slide_downloads(doc.get('slides', [])) if doc else []
+            # Only network and disk work happens here; the main thread decodes once everything has arrived
+            wait([download for download in downloads if download])
+        except Exception as e:
+            logger.error(f"Error in slide refresh worker: {e}")
+            # Still hand over a result, so the display loop does not wait for one forever
+            doc, downloads = None, []
+        try:
+            # A newer document supersedes a result the display loop has not picked up yet
+            discard_slide_downloads(*refreshed_slides.get_nowait())
+        except Empty:
+            pass
+        except Exception as e:
+            logger.warning(f"Error releasing superseded slide downloads: {e}")
+        refreshed_slides.put((doc, downloads))
+
+threading.Thread(target=slide_refresh_worker, daemon=True).start()
+
+# Function to turn the refresh worker's next result into slides
+def take_refreshed_slides(timeout=None):
+    """Decode the next refreshed document on the main thread; None if none arrived within timeout, [] if it has no slides"""
     try:
-        response = requests.get(status_doc_url, timeout=5)
+        doc, downloads = refreshed_slides.get(timeout=timeout)
+    except Empty:
+        return None
+    return process_slides_from_doc(doc, downloads) if doc else []
+
+# Function to read the current revision of the TV status document
+def fetch_status_rev(status_doc_url, status_doc_id):
+    """Return the status document's _rev, or None if it does not exist or cannot be read"""
+    try:
+        response = http_session.get(status_doc_url, timeout=5)
         if response.status_code == 200:
-            current_rev = response.json().get('_rev')
-        elif response.status_code != 404:
+            return response.json().get('_rev')
+        if response.status_code != 404:
             logger.warning(f"Error fetching status doc {status_doc_id}: {response.status_code} - {response.text}")
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error fetching status doc {status_doc_id}: {e}")
+    return None
+
+# Function to update TV status document in CouchDB
+def update_tv_status(couchdb_base_url, tv_doc_uuid, current_slide_info):
+    status_doc_id = f"status_{tv_doc_uuid}"
+    status_doc_url = f"{couchdb_base_url}/slideshows/{status_doc_id}"
+    current_rev = last_status_rev.get(status_doc_id)
+    if current_rev is None:
+        current_rev = fetch_status_rev(status_doc_url, status_doc_id)
     status_data = {
         "type": "tv_status",
         "tv_uuid": tv_doc_uuid,
@@ -1343,301 +1973,402 @@ def update_tv_status(couchdb_base_url, tv_doc_uuid, current_slide_info):
         "current_slide_filename": current_slide_info['filename'],
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
-    if current_rev:
-        status_data['_rev'] = current_rev
     try:
         headers = {'Content-Type': 'application/json'}
-        response = requests.put(status_doc_url, json=status_data, headers=headers, timeout=5)
+        for attempt in range(2):
+            if current_rev:
+                status_data['_rev'] = current_rev
+            else:
+                status_data.pop('_rev', None)
+            response = http_session.put(status_doc_url, json=status_data, headers=headers, timeout=5)
+            if response.status_code != 409 or attempt:
+                break
+            # Remembered revision is stale (document edited elsewhere); re-read it and retry once
+            logger.debug(f"Status doc {status_doc_id} revision conflict, refreshing _rev")
+            last_status_rev.pop(status_doc_id, None)
+            current_rev = fetch_status_rev(status_doc_url, status_doc_id)
         if response.status_code not in [200, 201]:
+            last_status_rev.pop(status_doc_id, None)
             logger.error(f"Error updating status doc {status_doc_id}: {response.status_code} - {response.text}")
         else:
+            last_status_rev[status_doc_id] = response.json().get('rev')
             logger.info(f"Successfully updated status for {tv_doc_uuid} to slide {current_slide_info['filename']}")
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error updating status doc {status_doc_id}: {e}")
 
+# Single background worker for status updates so slide changes never wait on CouchDB
+status_executor = ThreadPoolExecutor(max_workers=1)
+status_future = None  # Most recently submitted status update
+
+# Function to update TV status without blocking the display loop
+def update_tv_status_async(couchdb_base_url, tv_doc_uuid, current_slide_info):
+    """Submit a status update to the background worker, replacing one that has not started yet"""
+    global status_future
+    if status_future is not None and status_future.cancel():
+        logger.debug("Replaced pending TV status update with a newer slide")
+    status_future = status_executor.submit(update_tv_status, couchdb_base_url, tv_doc_uuid, current_slide_info)
+
+# Reusable canvas holding a slide composited with its static caption
+slide_canvas = None
+
+# Function to composite a slide image and its static caption
+def compose_slide_canvas(image, text_surface, text_rect):
+    """Draw image and caption onto the shared opaque canvas, reallocating it only when the slide size changes"""
+    global slide_canvas
+    if slide_canvas is None or slide_canvas.get_size() != image.get_size():
+        # The slide image covers the whole canvas, so it needs no per-pixel alpha
+        slide_canvas = pygame.Surface(image.get_size()).convert()
+    if image.get_flags() & pygame.SRCALPHA:
+        slide_canvas.fill((0, 0, 0))
+    slide_canvas.blit(image, (0, 0))
+    blit_text(slide_canvas, text_surface, text_rect)
+    return slide_canvas
+
+# Full-screen surfaces for cross-fades, allocated on the first transition
+transition_frames = None
+
+# Function to get the outgoing/incoming cross-fade surfaces
+def get_transition_frames():
+    """Return the reusable (outgoing, incoming) full-screen surfaces in the display format"""
+    global transition_frames
+    if transition_frames is None:
+        transition_frames = tuple(pygame.Surface((screen_width, screen_height)).convert() for _ in range(2))
+    return transition_frames
+
+# Function to render a full-screen status message once and reuse it
+@lru_cache(maxsize=4)
+def render_status_message(message):
+    """Render a status message, cached so the connecting/default screens do not reload the font each pass"""
+    font = pygame.font.SysFont(None, 24)
+    return font.render(message, True, (255, 255, 255))
+
 FADE_STEPS = 30
 
 # Main loop
-while True:
+while not shutdown_requested.is_set():
     if state == "connecting":
         screen.fill((0, 0, 0))
-        font = pygame.font.SysFont(None, 24)
-        text = font.render("Connecting to server...", True, (255, 255, 255))
+        text = render_status_message("Connecting to server...")
         text_rect = text.get_rect(center=(screen_width / 2, screen_height / 2))
         screen.blit(text, text_rect)
         safe_display_flip()
-        doc = fetch_document()
+        try:
+            doc, downloads = refreshed_slides.get(timeout=1)
+        except Empty:
+            continue
         if doc is not None:
             if doc:
-                slides = process_slides_from_doc(doc)
+                slides = process_slides_from_doc(doc, downloads)
                 if slides:
                     # Trigger immediate cleanup of unused attachments
                     cleanup_unused_attachments_immediate()
                     state = "slideshow"
                     current_slide_index = 0
                     first_slide_info = {'id': slides[0]['id'], 'filename': slides[0]['filename']}
-                    update_tv_status(couchdb_url, tv_uuid, first_slide_info)
+                    update_tv_status_async(couchdb_url, tv_uuid, first_slide_info)
                 else:
                     state = "default"
             else:
                 state = "default"
         else:
-            time.sleep(30)
+            # Server unreachable; have the refresh worker try again
+            shutdown_requested.wait(30)
+            need_refetch.set()
     elif state == "default":
         message = f"This TV is not configured. Please add it in the Slideshow Manager at {manager_url} with UUID: {tv_uuid}."
         screen.fill((0, 0, 0))
-        font = pygame.font.SysFont(None, 24)
-        text = font.render(message, True, (255, 255, 255))
+        text = render_status_message(message)
         text_rect = text.get_rect(center=(screen_width / 2, screen_height / 2))
         screen.blit(text, text_rect)
         safe_display_flip()
-        if need_refetch.is_set():
-            need_refetch.clear()
-            doc = fetch_document()
-            if doc:
-                slides = process_slides_from_doc(doc)
-                if slides:
-                    # Trigger immediate cleanup of unused attachments
-                    cleanup_unused_attachments_immediate()
-                    state = "slideshow"
-                    current_slide_index = 0
-                    first_slide_info = {'id': slides[0]['id'], 'filename': slides[0]['filename']}
-                    update_tv_status(couchdb_url, tv_uuid, first_slide_info)
-            time.sleep(1)
+        new_slides = take_refreshed_slides(timeout=1)
+        if new_slides:
+            slides = new_slides
+            # Trigger immediate cleanup of unused attachments
+            cleanup_unused_attachments_immediate()
+            state = "slideshow"
+            current_slide_index = 0
+            first_slide_info = {'id': slides[0]['id'], 'filename': slides[0]['filename']}
+            update_tv_status_async(couchdb_url, tv_uuid, first_slide_info)
     elif state == "slideshow":
         slide_index = current_slide_index
-        while slide_index < len(slides):
+        while slide_index < len(slides) and not shutdown_requested.is_set():
             slide_data = slides[slide_index]
             queue_website_capture(slides, slide_index)
             current_display_slide_info = {'id': slide_data['id'], 'filename': slide_data['filename']}
-            update_tv_status(couchdb_url, tv_uuid, current_display_slide_info)
+            update_tv_status_async(couchdb_url, tv_uuid, current_display_slide_info)
+            show_slide_at_index = False  # Set when a refresh put a different kind of slide at slide_index
             if slide_data['type'] == 'video':
                 video_cap = slide_data['video_cap']
-                start_time = time.time()
+                # Per-slide surfaces reused for every frame (decoded and scaled)
+                scaled_frame = None
+                scaled_surface = None
+                interpolation_key = None
+                current_text_state = None
+                video_geometry = get_video_geometry(video_cap)
+                letterbox_geometry = None
+                frame_queue, decoder_stop, decoder_thread = start_video_decoder(video_cap, slide_data['temp_file'])
                 slide_duration = validate_slide_duration(slide_data.get('duration'), slide_data.get('filename', 'Unknown'))
-                while time.time() - start_time < slide_duration:
-                    if need_refetch.is_set():
-                        need_refetch.clear()
-                        doc = fetch_document()
-                        if doc:
-                            new_slides = process_slides_from_doc(doc)
-                            if new_slides:
-                                cleanup_old_slides(slides)
-                                slides = new_slides
-                                # Trigger immediate cleanup of unused attachments
-                                cleanup_unused_attachments_immediate()
-                                # Resume from current slide index, or last valid index
-                                current_slide_index = min(slide_index, len(slides) - 1)
-                                slide_index = current_slide_index
-                                slide_data = slides[slide_index]
-                                start_time = time.time()
-                                slide_duration = validate_slide_duration(slide_data.get('duration'), slide_data.get('filename', 'Unknown'))
-                                video_cap = slide_data.get('video_cap')
-                                continue
-                            else:
-                                state = "default"
+                slide_deadline_ns = time.monotonic_ns() + int(slide_duration * 1e9)
+                while time.monotonic_ns() < slide_deadline_ns and not shutdown_requested.is_set():
+                    if not refreshed_slides.empty():
+                        new_slides = take_refreshed_slides()
+                        if new_slides:
+                            # Stop decoding before the old captures are released
+                            stop_video_decoder(decoder_stop, decoder_thread)
+                            cleanup_old_slides(slides)
+                            slides = new_slides
+                            # Trigger immediate cleanup of unused attachments
+                            cleanup_unused_attachments_immediate()
+                            # Resume from current slide index, or last valid index
+                            current_slide_index = min(slide_index, len(slides) - 1)
+                            slide_index = current_slide_index
+                            slide_data = slides[slide_index]
+                            slide_duration = validate_slide_duration(slide_data.get('duration'), slide_data.get('filename', 'Unknown'))
+                            slide_deadline_ns = time.monotonic_ns() + int(slide_duration * 1e9)
+                            video_cap = slide_data.get('video_cap')
+                            if not video_cap:
+                                # Show the new slide at this index instead of skipping past it
+                                show_slide_at_index = True
                                 break
+                            video_geometry = get_video_geometry(video_cap)
+                            frame_queue, decoder_stop, decoder_thread = start_video_decoder(video_cap, slide_data['temp_file'])
+                            continue
                         else:
                             state = "default"
                             break
-                    ret, frame = video_cap.read()
-                    if not ret:
-                        video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                        ret, frame = video_cap.read()
-                        if not ret:
-                            break
-                    surface = cv2_to_pygame(frame)
-                    if surface:
-                        frame_width, frame_height = surface.get_size()
-                        width_ratio = screen_width / frame_width
-                        height_ratio = screen_height / frame_height
-                        scale_ratio = min(width_ratio, height_ratio)
-                        new_width = int(frame_width * scale_ratio)
-                        new_height = int(frame_height * scale_ratio)
-                        scaled_surface = pygame.transform.smoothscale(surface, (new_width, new_height))
-                        center_x = (screen_width - new_width) // 2
-                        center_y = (screen_height - new_height) // 2
-                        screen.fill((0, 0, 0))
+                    try:
+                        frame = frame_queue.get(timeout=1)
+                    except Empty:
+                        logger.warning("Timed out waiting for decoded video frame")
+                        continue
+                    if frame is None:
+                        break
+                    if video_geometry is None:
+                        # Capture did not report its size; derive it from the first frame
+                        video_geometry = calculate_fit_geometry(frame.shape[1], frame.shape[0], screen_width, screen_height)
+                    new_width, new_height, center_x, center_y = video_geometry
+                    if scaled_frame is None or scaled_frame.shape[:2] != (new_height, new_width):
+                        # Preallocate the resize target; the pygame surface wraps this buffer
+                        scaled_frame = np.empty((new_height, new_width, 3), dtype=np.uint8)
+                        scaled_surface = None
+                    if interpolation_key != (frame.shape[:2], video_geometry):
+                        # A refresh can swap in a video of another source size at the same display size
+                        interpolation_key = (frame.shape[:2], video_geometry)
+                        video_interpolation = cv2.INTER_AREA if new_width < frame.shape[1] else cv2.INTER_LINEAR
+                    cv2.resize(frame, (new_width, new_height), dst=scaled_frame, interpolation=video_interpolation)
+                    if scaled_surface is None or not frame_buffers_shared:
+                        scaled_surface = cv2_to_pygame(scaled_frame)
+                    if scaled_surface:
+                        # Letterbox bars only need clearing when the frame geometry changes;
+                        # every frame fully covers the previous one inside the video area
+                        if video_geometry != letterbox_geometry:
+                            screen.fill((0, 0, 0))
+                            letterbox_geometry = video_geometry
                         screen.blit(scaled_surface, (center_x, center_y))
                         if slide_data.get('text_params') and slide_data['text_params'].get('text'):
                             text_params = slide_data['text_params']
-                            if '{datetime}' in text_params.get('text', ''):
-                                temp_surface = pygame.Surface((scaled_surface.get_width(), scaled_surface.get_height()), pygame.SRCALPHA)
-                                current_text_surface, current_text_rect = get_cached_text_surface(temp_surface, text_params)
+                            # Only re-resolve the overlay when the slide, frame size or datetime minute changes
+                            text_state = (id(slide_data), (new_width, new_height),
+                                          int(time.time() // 60) if '{datetime}' in text_params['text'] else None)
+                            if text_state != current_text_state:
+                                current_text_state = text_state
+                                current_text_surface, current_text_rect = get_cached_text_surface(scaled_surface, text_params)
                                 if current_text_surface and current_text_rect:
                                     text_surface = current_text_surface
                                     text_rect = current_text_rect
                                 else:
                                     text_surface = slide_data.get('text_surface')
                                     text_rect = slide_data.get('text_rect')
-                            else:
-                                text_surface = slide_data.get('text_surface')
-                                text_rect = slide_data.get('text_rect')
                             if text_surface and text_rect:
-                                screen.blit(text_surface, (center_x + text_rect.left, center_y + text_rect.top))
+                                blit_text(screen, text_surface, (center_x + text_rect.left, center_y + text_rect.top))
                         safe_display_flip()
                     for event in pygame.event.get():
                         if event.type == pygame.QUIT:
-                            pygame.quit()
-                            sys.exit()
+                            shutdown_requested.set()
                         if event.type == pygame.KEYDOWN:
                             if event.key == pygame.K_ESCAPE:
-                                pygame.quit()
-                                sys.exit()
-                    # Dynamic frame timing for smooth scrolling
-                    current_frame_time = time.time()
-                    if last_frame_time > 0:
-                        frame_duration = current_frame_time - last_frame_time
-                        target_frame_time = 1.0 / 30.0  # Target 30 FPS
-                        sleep_time = max(0, target_frame_time - frame_duration)
-                    else:
-                        sleep_time = 1.0 / 30.0
-                    last_frame_time = current_frame_time
-                    time.sleep(sleep_time)
-                # Cleanup video resources using the cleanup function
-                if slide_data.get('cleanup_func'):
-                    slide_data['cleanup_func']()
+                                shutdown_requested.set()
+                    # Fixed-period frame timing for smooth scrolling
+                    pace_frame()
+                # The capture and temp file stay with the slide for its next pass; cleanup_old_slides releases them
+                stop_video_decoder(decoder_stop, decoder_thread)
             else:
                 img_width, img_height = slide_data['image'].get_size()
                 center_x = (screen_width - img_width) // 2
                 center_y = (screen_height - img_height) // 2
                 scroll_x = screen_width
-                scroll_start_time = time.time()  # Track scrolling timing
+                scroll_start_time = time.monotonic()  # Track scrolling timing
                 scroll_cycle_complete = False  # Track scroll cycle state
                 incoming_transition_duration_ms = slide_data.get('transition_time', 0)
                 if incoming_transition_duration_ms > 0:
-                    delay_per_step = (incoming_transition_duration_ms / FADE_STEPS) / 1000.0
-                    slide_render_surface = pygame.Surface((img_width, img_height), pygame.SRCALPHA)
-                    slide_render_surface.blit(slide_data['image'], (0,0))
+                    step_ns = incoming_transition_duration_ms * 1_000_000 // FADE_STEPS
+                    # Cross-fade from whatever is on screen (previous slide or video frame) to the
+                    # incoming slide, letterbox included, instead of cutting to black first
+                    outgoing_frame, incoming_frame = get_transition_frames()
+                    outgoing_frame.blit(screen, (0, 0))
+                    incoming_frame.fill((0,0,0))
+                    incoming_frame.blit(slide_data['image'], (center_x, center_y))
                     if slide_data.get('text_surface') and not slide_data.get('scroll_text'):
-                        slide_render_surface.blit(slide_data['text_surface'], slide_data['text_rect'])
+                        # Static caption fades in together with the image
+                        blit_text(incoming_frame, slide_data['text_surface'], slide_data['text_rect'].move(center_x, center_y))
+                    fade_start_ns = time.monotonic_ns()
                     for alpha_step in range(FADE_STEPS + 1):
-                        if need_refetch.is_set():
+                        if not refreshed_slides.empty():
                             break
                         alpha_value = int((alpha_step / FADE_STEPS) * 255)
-                        slide_render_surface.set_alpha(alpha_value)
-                        screen.fill((0,0,0))
-                        screen.blit(slide_render_surface, (center_x, center_y))
+                        incoming_frame.set_alpha(alpha_value)
+                        screen.blit(outgoing_frame, (0, 0))
+                        screen.blit(incoming_frame, (0, 0))
                         safe_display_flip()
-                        time.sleep(delay_per_step)
-                    if need_refetch.is_set():
-                        need_refetch.clear()
-                        doc = fetch_document()
-                        if doc:
-                            new_slides = process_slides_from_doc(doc)
-                            if new_slides:
-                                cleanup_old_slides(slides)
-                                slides = new_slides
-                                # Trigger immediate cleanup of unused attachments
-                                cleanup_unused_attachments_immediate()
-                                current_slide_index = min(slide_index, len(slides) - 1)
-                                slide_index = current_slide_index
-                                slide_data = slides[slide_index]
-                                continue
-                            else:
-                                state = "default"
-                                break
+                        # Sleep to each step's absolute deadline so blit/flip time does not stretch the fade
+                        remaining_ns = fade_start_ns + (alpha_step + 1) * step_ns - time.monotonic_ns()
+                        if remaining_ns > 0:
+                            time.sleep(remaining_ns / 1e9)
+                    if not refreshed_slides.empty():
+                        new_slides = take_refreshed_slides()
+                        if new_slides:
+                            cleanup_old_slides(slides)
+                            slides = new_slides
+                            # Trigger immediate cleanup of unused attachments
+                            cleanup_unused_attachments_immediate()
+                            current_slide_index = min(slide_index, len(slides) - 1)
+                            slide_index = current_slide_index
+                            slide_data = slides[slide_index]
+                            continue
                         else:
                             state = "default"
                             break
-                start_time = time.time()
                 slide_duration = validate_slide_duration(slide_data.get('duration'), slide_data.get('filename', 'Unknown'))
-                while time.time() - start_time < slide_duration:
-                    if need_refetch.is_set():
-                        need_refetch.clear()
-                        doc = fetch_document()
-                        if doc:
-                            new_slides = process_slides_from_doc(doc)
-                            if new_slides:
-                                cleanup_old_slides(slides)
-                                slides = new_slides
-                                # Trigger immediate cleanup of unused attachments
-                                cleanup_unused_attachments_immediate()
-                                current_slide_index = min(slide_index, len(slides) - 1)
-                                slide_index = current_slide_index
-                                slide_data = slides[slide_index]
-                                start_time = time.time()
-                                slide_duration = validate_slide_duration(slide_data.get('duration'), slide_data.get('filename', 'Unknown'))
-                                continue
-                            else:
-                                state = "default"
-                                break
+                slide_deadline_ns = time.monotonic_ns() + int(slide_duration * 1e9)
+                current_text_state = None
+                drawn_slide_id = None
+                drawn_frame_state = None
+                scroll_dirty_rect = None
+                while time.monotonic_ns() < slide_deadline_ns and not shutdown_requested.is_set():
+                    if not refreshed_slides.empty():
+                        new_slides = take_refreshed_slides()
+                        if new_slides:
+                            cleanup_old_slides(slides)
+                            slides = new_slides
+                            # Trigger immediate cleanup of unused attachments
+                            cleanup_unused_attachments_immediate()
+                            current_slide_index = min(slide_index, len(slides) - 1)
+                            slide_index = current_slide_index
+                            slide_data = slides[slide_index]
+                            slide_duration = validate_slide_duration(slide_data.get('duration'), slide_data.get('filename', 'Unknown'))
+                            slide_deadline_ns = time.monotonic_ns() + int(slide_duration * 1e9)
+                            continue
                         else:
                             state = "default"
                             break
                     if state == "default":
                         break
-                    screen.fill((0, 0, 0))
-                    screen.blit(slide_data['image'], (center_x, center_y))
+                    if id(slide_data) != drawn_slide_id:
+                        # New (or refetched) slide: recentre and clear the letterbox once
+                        img_width, img_height = slide_data['image'].get_size()
+                        center_x = (screen_width - img_width) // 2
+                        center_y = (screen_height - img_height) // 2
+                        screen.fill((0, 0, 0))
+                        drawn_slide_id = id(slide_data)
+                        scroll_dirty_rect = None
+                        drawn_frame_state = None
+                    slide_surface = slide_data['image']
+                    scrolling = False
                     if slide_data.get('text_params') and slide_data['text_params'].get('text'):
                         text_params = slide_data['text_params']
-                        if '{datetime}' in text_params.get('text', ''):
-                            current_text_surface, current_text_rect = get_cached_text_surface(slide_data['image'], text_params)
-                            if current_text_surface and current_text_rect:
-                                text_surface = current_text_surface
-                                original_text_rect = current_text_rect
+                        # Only re-resolve the overlay when the slide or datetime minute changes
+                        text_state = (id(slide_data),
+                                      int(time.time() // 60) if '{datetime}' in text_params['text'] else None)
+                        if text_state != current_text_state:
+                            current_text_state = text_state
+                            if text_state[1] is not None:
+                                current_text_surface, current_text_rect = get_cached_text_surface(slide_data['image'], text_params)
+                                if current_text_surface and current_text_rect:
+                                    text_surface = current_text_surface
+                                    original_text_rect = current_text_rect
+                                else:
+                                    text_surface = slide_data.get('text_surface')
+                                    original_text_rect = slide_data.get('text_rect')
                             else:
                                 text_surface = slide_data.get('text_surface')
                                 original_text_rect = slide_data.get('text_rect')
-                        else:
-                            text_surface = slide_data.get('text_surface')
-                            original_text_rect = slide_data.get('text_rect')
-                        if text_surface and original_text_rect:
-                            if slide_data.get('scroll_text'):
-                                # Time-based scrolling for smooth animation
-                                current_time = time.time()
-                                elapsed_time = current_time - scroll_start_time
-                                
+                            if text_surface:
                                 # Calculate dynamic scroll speed based on text content
                                 text_width = text_surface.get_width()
                                 dynamic_scroll_speed = calculate_scroll_speed(text_width, screen_width, scroll_speed_pixels_per_second)
+                            composed_slide = None
+                            if text_surface and original_text_rect and not slide_data.get('scroll_text'):
+                                # Static caption: composite it once so each frame is a single blit
+                                composed_slide = compose_slide_canvas(slide_data['image'], text_surface, original_text_rect)
+                        if composed_slide is not None:
+                            slide_surface = composed_slide
+                        scrolling = bool(text_surface and original_text_rect and slide_data.get('scroll_text'))
+                        if scrolling:
+                            # Time-based scrolling for smooth animation
+                            current_time = time.monotonic()
+                            elapsed_time = current_time - scroll_start_time
+                            
+                            if not scroll_cycle_complete:
+                                scroll_x = screen_width - (elapsed_time * dynamic_scroll_speed)
                                 
-                                if not scroll_cycle_complete:
-                                    scroll_x = screen_width - (elapsed_time * dynamic_scroll_speed)
-                                    
-                                    # Check if text has completely exited screen
-                                    if scroll_x < -text_width:
-                                        scroll_cycle_complete = True
-                                        scroll_start_time = current_time  # Start pause timer
-                                        scroll_x = -text_width  # Keep text just off screen
-                                else:
-                                    # Pause period after scroll completion
-                                    if elapsed_time >= scroll_pause_duration:
-                                        # Reset for next scroll cycle
-                                        scroll_cycle_complete = False
-                                        scroll_start_time = current_time
-                                        scroll_x = screen_width
-                                    else:
-                                        # Keep text off screen during pause
-                                        scroll_x = -text_width
-                                
-                                screen.blit(text_surface, (int(scroll_x), center_y + original_text_rect.top))
+                                # Check if text has completely exited screen
+                                if scroll_x < -text_width:
+                                    scroll_cycle_complete = True
+                                    scroll_start_time = current_time  # Start pause timer
+                                    scroll_x = -text_width  # Keep text just off screen
                             else:
-                                screen.blit(text_surface, (center_x + original_text_rect.left, center_y + original_text_rect.top))
-                    safe_display_flip()
+                                # Pause period after scroll completion
+                                if elapsed_time >= scroll_pause_duration:
+                                    # Reset for next scroll cycle
+                                    scroll_cycle_complete = False
+                                    scroll_start_time = current_time
+                                    scroll_x = screen_width
+                                else:
+                                    # Keep text off screen during pause
+                                    scroll_x = -text_width
+                    # Static slides, scroll pauses and sub-pixel scroll steps leave the frame unchanged;
+                    # skip the redraw and flip entirely in that case
+                    frame_state = (drawn_slide_id, current_text_state, int(scroll_x) if scrolling else None)
+                    if frame_state != drawn_frame_state:
+                        scroll_only = scrolling and drawn_frame_state is not None and drawn_frame_state[:2] == frame_state[:2]
+                        drawn_frame_state = frame_state
+                        if scroll_only:
+                            # Only the scroll position moved: repaint and present just the text's row band
+                            scroll_strip = pygame.Rect(0, center_y + original_text_rect.top, screen_width, text_surface.get_height())
+                            screen.set_clip(scroll_strip)
+                        if scroll_dirty_rect:
+                            # Scrolling text may have been drawn over the letterbox bars
+                            screen.fill((0, 0, 0), scroll_dirty_rect)
+                        screen.blit(slide_surface, (center_x, center_y))
+                        if scrolling:
+                            scroll_dirty_rect = blit_text(screen, text_surface, (int(scroll_x), center_y + original_text_rect.top))
+                        if scroll_only:
+                            screen.set_clip(None)
+                            safe_display_flip([scroll_strip])
+                        else:
+                            safe_display_flip()
                     for event in pygame.event.get():
                         if event.type == pygame.QUIT:
-                            pygame.quit()
-                            sys.exit()
+                            shutdown_requested.set()
                         if event.type == pygame.KEYDOWN:
                             if event.key == pygame.K_ESCAPE:
-                                pygame.quit()
-                                sys.exit()
-                    # Dynamic frame timing for smooth scrolling
-                    current_frame_time = time.time()
-                    if last_frame_time > 0:
-                        frame_duration = current_frame_time - last_frame_time
-                        target_frame_time = 1.0 / 30.0  # Target 30 FPS
-                        sleep_time = max(0, target_frame_time - frame_duration)
-                    else:
-                        sleep_time = 1.0 / 30.0
-                    last_frame_time = current_frame_time
-                    time.sleep(sleep_time)
-                if need_refetch.is_set():
+                                shutdown_requested.set()
+                    # Fixed-period frame timing for smooth scrolling
+                    pace_frame()
+                if not refreshed_slides.empty():
                     continue
             if state == "default":
                 break
+            if show_slide_at_index:
+                continue
             slide_index += 1
             current_slide_index = slide_index % len(slides)
             if slide_index >= len(slides):
                 slide_index = 0
+
+# Shutting down: any decode thread has been joined by now, so release the video
+# captures before atexit removes video_temp_dir and waits for pending uploads
+logger.info("Shutting down")
+cleanup_old_slides(slides)
+pygame.quit()
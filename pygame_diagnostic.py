@@ -4,16 +4,79 @@ Pygame Display Diagnostic Script
 Helps debug display driver issues on Raspberry Pi
 """
 
+import argparse
+import grp
+import json
 import os
+import re
+import stat
 import sys
 import subprocess
+import tempfile
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger()
 
+# Per-thread record buffer so checks run in parallel still print in order
+_check_buffer = threading.local()
+
+class CheckBufferFilter(logging.Filter):
+    """Divert records into the calling thread's check buffer, if it has one"""
+    def filter(self, record):
+        records = getattr(_check_buffer, 'records', None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
+logger.addFilter(CheckBufferFilter())
+
+DPKG_STATUS_PATH = '/var/lib/dpkg/status'
+# Per-user cache, so a root run never reads or writes a file another user can plant
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'pygame_diagnostic')
+CACHE_PATH = os.path.join(CACHE_DIR, 'packages.json')
+
+# Framebuffers used by the dual HDMI setup
+FRAMEBUFFER_ROLES = {
+    'fb0': "HDMI0 console",
+    'fb1': "HDMI1 slideshow",
+}
+
+# Boot files written by the hdmi role (Raspberry Pi OS layout first, then legacy)
+BOOT_CONFIG_PATHS = ['/boot/firmware/config.txt', '/boot/config.txt']
+BOOT_CMDLINE_PATHS = ['/boot/firmware/cmdline.txt', '/boot/cmdline.txt']
+
+# (key, hdmi port) -> value the dual HDMI setup expects in config.txt
+EXPECTED_BOOT_CONFIG = {
+    ('hdmi_group', '0'): '1',
+    ('hdmi_group', '1'): '1',
+    ('hdmi_mode', '0'): '16',
+    ('hdmi_mode', '1'): '16',
+    ('hdmi_force_hotplug', '0'): '1',
+    ('hdmi_force_hotplug', '1'): '1',
+    ('dtoverlay', None): 'vc4-fkms-v3d',
+}
+BOOT_CMDLINE_RE = re.compile(r'(?<!\S)(consoleblank=0|fbcon=map:0)(?!\S)')
+BOOT_CONFIG_RE = re.compile(r'(\s*#\s*)?(hdmi_group|hdmi_mode|hdmi_force_hotplug|dtoverlay)(?::([01]))?\s*=\s*(\S+)')
+
+def stat_access(st):
+    """Derive (readable, writable) for the current user from a stat result's mode bits"""
+    euid = os.geteuid()
+    if euid == 0:
+        return True, True
+    if st.st_uid == euid:
+        read_bit, write_bit = stat.S_IRUSR, stat.S_IWUSR
+    elif st.st_gid in os.getgroups() or st.st_gid == os.getegid():
+        read_bit, write_bit = stat.S_IRGRP, stat.S_IWGRP
+    else:
+        read_bit, write_bit = stat.S_IROTH, stat.S_IWOTH
+    return bool(st.st_mode & read_bit), bool(st.st_mode & write_bit)
+
 def check_system_info():
     """Check basic system information"""
     logger.info("=== SYSTEM INFORMATION ===")
@@ -28,41 +91,202 @@ def check_system_info():
     
     # User groups
     try:
-        result = subprocess.run(['groups'], capture_output=True, text=True)
-        logger.info(f"User groups: {result.stdout.strip()}")
-    except:
+        group_names = []
+        for gid in dict.fromkeys([os.getegid()] + os.getgroups()):
+            try:
+                group_names.append(grp.getgrgid(gid).gr_name)
+            except KeyError:
+                group_names.append(str(gid))
+        logger.info(f"User groups: {' '.join(group_names)}")
+        if 'video' not in group_names and os.geteuid() != 0:
+            logger.warning("User is not in the video group (framebuffer/DRM access may fail)")
+    except OSError:
         logger.error("Could not get user groups")
     
     # Check devices
     logger.info("=== DEVICE STATUS ===")
     
-    # DRM devices
+    # DRM devices (one directory scan; stat results come from the DirEntry)
     drm_path = "/dev/dri"
-    if os.path.exists(drm_path):
-        drm_devices = os.listdir(drm_path)
-        logger.info(f"DRM devices: {drm_devices}")
-        for device in drm_devices:
-            device_path = os.path.join(drm_path, device)
-            readable = os.access(device_path, os.R_OK)
-            writable = os.access(device_path, os.W_OK)
-            logger.info(f"  {device_path}: readable={readable}, writable={writable}")
+    try:
+        drm_entries = sorted(os.scandir(drm_path), key=lambda e: e.name)
+    except FileNotFoundError:
+        drm_entries = None
+    if drm_entries is not None:
+        logger.info(f"DRM devices: {[e.name for e in drm_entries]}")
+        for entry in drm_entries:
+            readable, writable = stat_access(entry.stat())
+            logger.info(f"  {entry.path}: readable={readable}, writable={writable}")
     else:
         logger.warning("No /dev/dri directory found")
     
-    # Framebuffer devices
-    fb_devices = [f"/dev/fb{i}" for i in range(3)]
-    for fb in fb_devices:
-        if os.path.exists(fb):
-            readable = os.access(fb, os.R_OK)
-            writable = os.access(fb, os.W_OK)
-            logger.info(f"Framebuffer {fb}: exists=True, readable={readable}, writable={writable}")
-        else:
-            logger.info(f"Framebuffer {fb}: exists=False")
+    # Framebuffer devices (one /dev scan finds every fbN, whatever the count)
+    fb_entries = sorted((e for e in os.scandir('/dev') if e.name.startswith('fb') and e.name[2:].isdigit()),
+                        key=lambda e: int(e.name[2:]))
+    fb_found = {e.name for e in fb_entries}
+    for name, description in FRAMEBUFFER_ROLES.items():
+        if name not in fb_found:
+            logger.info(f"Framebuffer /dev/{name} ({description}): exists=False")
+    for entry in fb_entries:
+        readable, writable = stat_access(entry.stat())
+        description = FRAMEBUFFER_ROLES.get(entry.name, "additional")
+        logger.info(f"Framebuffer {entry.path} ({description}): exists=True, readable={readable}, writable={writable}")
+
+def first_existing_path(paths):
+    """Return the first path in the list that exists, or None"""
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+def check_boot_config():
+    """Check config.txt and cmdline.txt for the dual HDMI settings"""
+    logger.info("=== BOOT CONFIGURATION ===")
+    
+    config_path = first_existing_path(BOOT_CONFIG_PATHS)
+    if config_path:
+        # Stream the file once; a cheap literal test drops unrelated lines before the regex,
+        # and scanning stops as soon as every expected setting has been seen active
+        active = {}
+        commented = {}
+        remaining = set(EXPECTED_BOOT_CONFIG)
+        try:
+            with open(config_path, 'r') as f:
+                for line in f:
+                    if 'hdmi' not in line and 'dtoverlay' not in line:
+                        continue
+                    match = BOOT_CONFIG_RE.match(line)
+                    if not match:
+                        continue
+                    comment, key, port, value = match.groups()
+                    target = commented if comment else active
+                    target.setdefault((key, port), set()).add(value)
+                    if not comment and EXPECTED_BOOT_CONFIG.get((key, port)) == value:
+                        remaining.discard((key, port))
+                        if not remaining:
+                            break
+            config_read = True
+        except OSError as e:
+            logger.error(f"Could not read {config_path}: {e}")
+            config_read = False
+        if config_read:
+            for (key, port), expected in EXPECTED_BOOT_CONFIG.items():
+                name = f"{key}:{port}" if port is not None else key
+                if expected in active.get((key, port), ()):
+                    logger.info(f"{config_path}: {name}={expected}")
+                elif expected in commented.get((key, port), ()):
+                    logger.warning(f"{config_path}: {name}={expected} is commented out")
+                else:
+                    logger.warning(f"{config_path}: {name}={expected} not set")
+    else:
+        logger.info("No config.txt found (not a Raspberry Pi OS boot partition)")
+    
+    cmdline_path = first_existing_path(BOOT_CMDLINE_PATHS)
+    if cmdline_path:
+        try:
+            with open(cmdline_path, 'r') as f:
+                options = set(BOOT_CMDLINE_RE.findall(f.read()))
+            if 'consoleblank=0' in options:
+                logger.info(f"{cmdline_path}: consoleblank=0 present")
+            else:
+                logger.warning(f"{cmdline_path}: consoleblank=0 missing (console may blank the display)")
+            if 'fbcon=map:0' in options:
+                logger.info(f"{cmdline_path}: fbcon=map:0 present (console pinned to fb0)")
+        except OSError as e:
+            logger.error(f"Could not read {cmdline_path}: {e}")
+
+def read_installed_packages(packages, status_path=DPKG_STATUS_PATH):
+    """Return {package: version} for installed packages from the dpkg database, or None if unreadable"""
+    installed = {}
+    try:
+        with open(status_path, 'r') as f:
+            fields = {}
+            for line in f:
+                if line.strip():
+                    key, sep, value = line.partition(':')
+                    if sep and not line[0].isspace():
+                        fields[key] = value.strip()
+                    continue
+                # Blank line ends a package stanza
+                if fields.get('Package') in packages and fields.get('Status', '').endswith(' installed'):
+                    installed[fields['Package']] = fields.get('Version', 'unknown')
+                fields = {}
+            if fields.get('Package') in packages and fields.get('Status', '').endswith(' installed'):
+                installed[fields['Package']] = fields.get('Version', 'unknown')
+    except OSError as e:
+        logger.warning(f"Could not read dpkg status database: {e}")
+        return None
+    return installed
+
+def boot_time():
+    """Return the kernel boot time (btime from /proc/stat), or None if unavailable"""
+    try:
+        with open('/proc/stat', 'r') as f:
+            for line in f:
+                if line.startswith('btime '):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+def read_package_cache():
+    """Return the cached package report, or None if it is missing, unreadable or not owned by this user"""
+    try:
+        fd = os.open(CACHE_PATH, os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError:
+        return None
+    with os.fdopen(fd, 'r') as f:
+        if os.fstat(f.fileno()).st_uid != os.getuid():
+            logger.debug(f"Ignoring diagnostic cache {CACHE_PATH}: not owned by this user")
+            return None
+        try:
+            return json.load(f)
+        except ValueError:
+            return None
+
+def write_package_cache(cache):
+    """Atomically replace the package cache; the temp file is created exclusively inside CACHE_DIR"""
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    if os.stat(CACHE_DIR).st_uid != os.getuid():
+        raise OSError(f"{CACHE_DIR} is not owned by this user")
+    fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        os.replace(temp_path, CACHE_PATH)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def cached_installed_packages(packages):
+    """Return read_installed_packages(), reused from the user's cache until the dpkg database changes or the system reboots"""
+    try:
+        cache_key = [os.path.getmtime(DPKG_STATUS_PATH), boot_time(), sorted(packages)]
+    except OSError:
+        return read_installed_packages(packages)
+    cache = read_package_cache()
+    if isinstance(cache, dict) and cache.get('key') == cache_key and isinstance(cache.get('installed'), dict):
+        logger.debug(f"Using cached package information from {CACHE_PATH}")
+        return cache['installed']
+    installed = read_installed_packages(packages)
+    if installed is not None:
+        try:
+            write_package_cache({'key': cache_key, 'installed': installed})
+        except OSError as e:
+            logger.debug(f"Could not write diagnostic cache {CACHE_PATH}: {e}")
+    return installed
+
+def log_package_report(packages, installed):
+    """Log the SDL2 section as one record for installed packages and one for missing ones"""
+    lines = ["=== SDL2 INFORMATION ==="]
+    lines += [f"Package {package}: {installed[package]} (installed)" for package in packages if package in installed]
+    logger.info('\n'.join(lines))
+    missing = [f"Package {package}: not installed" for package in packages if package not in installed]
+    if missing:
+        logger.warning('\n'.join(missing))
 
 def check_sdl2_info():
     """Check SDL2 installation and capabilities"""
-    logger.info("=== SDL2 INFORMATION ===")
-    
     # Check SDL2 packages
     packages_to_check = [
         'libsdl2-2.0-0',
@@ -72,23 +296,43 @@ def check_sdl2_info():
         'mesa-utils'
     ]
     
-    for package in packages_to_check:
-        try:
-            result = subprocess.run(['dpkg', '-l', package], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                # Extract version from dpkg output
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.startswith('ii'):
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            logger.info(f"Package {package}: {parts[2]} (installed)")
-                        break
-            else:
-                logger.warning(f"Package {package}: not installed")
-        except:
-            logger.error(f"Could not check package {package}")
+    # Read the dpkg database once instead of spawning dpkg per package
+    installed = cached_installed_packages(packages_to_check)
+    if installed is not None:
+        log_package_report(packages_to_check, installed)
+        return
+    
+    # Fall back to a single dpkg-query for all packages; it exits non-zero
+    # when any package is unknown but still prints the ones it found
+    try:
+        result = subprocess.run(['dpkg-query', '-W', '-f=${Package}\t${Version}\t${Status}\n'] + packages_to_check,
+                                capture_output=True, text=True)
+    except Exception as e:
+        logger.info("=== SDL2 INFORMATION ===")
+        logger.error(f"Could not check packages: {e}")
+        return
+    installed = {}
+    for line in result.stdout.splitlines():
+        parts = line.split('\t')
+        if len(parts) == 3 and parts[2].endswith(' installed'):
+            installed[parts[0]] = parts[1]
+    log_package_report(packages_to_check, installed)
+
+def driver_prerequisites(driver):
+    """Return None if the driver's device/session is present, else a reason to skip it"""
+    if driver == 'kmsdrm':
+        if not os.path.isdir('/dev/dri') or not any(f.startswith('card') for f in os.listdir('/dev/dri')):
+            return "no DRM card in /dev/dri"
+    elif driver == 'fbcon':
+        if not os.path.exists('/dev/fb1'):
+            return "/dev/fb1 not present"
+    elif driver == 'wayland':
+        if not os.environ.get('WAYLAND_DISPLAY'):
+            return "WAYLAND_DISPLAY not set"
+    elif driver == 'x11':
+        if not os.environ.get('DISPLAY'):
+            return "DISPLAY not set"
+    return None
 
 def test_pygame_drivers():
     """Test pygame driver capabilities"""
@@ -102,27 +346,38 @@ def test_pygame_drivers():
         logger.error(f"Could not import pygame: {e}")
         return
     
+    # Only the display subsystem is needed; each driver test initialises it inside its own try
+    saved_environ = os.environ.copy()
+    
     # Test driver availability without initializing display
     drivers_to_test = ['kmsdrm', 'fbcon', 'directfb', 'wayland', 'x11']
     
     for driver in drivers_to_test:
+        # pygame has no API listing compiled-in video drivers, so skip the
+        # ones whose device or session is missing instead of re-initialising SDL
+        skip_reason = driver_prerequisites(driver)
+        if skip_reason:
+            logger.info(f"Skipping driver {driver}: {skip_reason}")
+            continue
+        
         logger.info(f"Testing driver: {driver}")
         
-        # Set environment
-        os.environ['SDL_VIDEODRIVER'] = driver
+        # Set environment for this driver only
+        env_patch = {'SDL_VIDEODRIVER': driver}
         if driver == 'fbcon':
-            os.environ['SDL_FBDEV'] = '/dev/fb1'
-            os.environ['SDL_NOMOUSE'] = '1'
+            env_patch['SDL_FBDEV'] = '/dev/fb1'
+            env_patch['SDL_NOMOUSE'] = '1'
         elif driver == 'kmsdrm':
             if os.path.exists('/dev/dri'):
                 drm_devices = [f for f in os.listdir('/dev/dri') if f.startswith('card')]
                 if drm_devices:
-                    os.environ['SDL_DRM_DEVICE'] = f'/dev/dri/{drm_devices[0]}'
+                    env_patch['SDL_DRM_DEVICE'] = f'/dev/dri/{drm_devices[0]}'
+        os.environ.update(env_patch)
         
         try:
-            # Initialize pygame
-            pygame.quit()
-            pygame.init()
+            # Restart just the display so SDL picks up the new driver
+            pygame.display.quit()
+            pygame.display.init()
             
             # Check if this driver is actually being used
             actual_driver = pygame.display.get_driver()
@@ -140,17 +395,21 @@ def test_pygame_drivers():
                 
         except Exception as e:
             logger.warning(f"  FAILED to initialize pygame with {driver}: {e}")
+        
+        # Drop this driver's settings so they do not leak into the next test
+        for key in env_patch:
+            os.environ.pop(key, None)
     
     # Clean up
     try:
-        pygame.quit()
+        pygame.display.quit()
     except:
         pass
+    os.environ.clear()
+    os.environ.update(saved_environ)
 
 def test_environment_vars():
     """Test various environment variable combinations"""
-    logger.info("=== ENVIRONMENT VARIABLE TESTS ===")
-    
     env_vars = {
         'SDL_VIDEODRIVER': os.environ.get('SDL_VIDEODRIVER', 'not set'),
         'SDL_FBDEV': os.environ.get('SDL_FBDEV', 'not set'),
@@ -159,8 +418,9 @@ def test_environment_vars():
         'WAYLAND_DISPLAY': os.environ.get('WAYLAND_DISPLAY', 'not set'),
     }
     
-    for var, value in env_vars.items():
-        logger.info(f"{var}: {value}")
+    lines = ["=== ENVIRONMENT VARIABLE TESTS ==="]
+    lines += [f"{var}: {value}" for var, value in env_vars.items()]
+    logger.info('\n'.join(lines))
 
 def check_kernel_modules():
     """Check loaded kernel modules"""
@@ -168,33 +428,62 @@ def check_kernel_modules():
     
     modules_to_check = ['drm', 'vc4', 'drm_kms_helper', 'drm_display_helper']
     
+    # /proc/modules is what lsmod formats; read it directly into a name -> line map
     try:
-        result = subprocess.run(['lsmod'], capture_output=True, text=True)
-        lsmod_output = result.stdout
-        
-        for module in modules_to_check:
-            if module in lsmod_output:
-                # Extract module info
-                for line in lsmod_output.split('\n'):
-                    if line.startswith(module):
-                        logger.info(f"Module {module}: {line}")
-                        break
-            else:
-                logger.warning(f"Module {module}: not loaded")
-                
-    except Exception as e:
+        with open('/proc/modules', 'r') as f:
+            loaded = {line.split(None, 1)[0]: line.rstrip() for line in f if line.strip()}
+    except OSError as e:
         logger.error(f"Could not check kernel modules: {e}")
+        return
+    
+    for module in modules_to_check:
+        if module in loaded:
+            logger.info(f"Module {module}: {loaded[module]}")
+        else:
+            logger.warning(f"Module {module}: not loaded")
+
+def run_buffered_check(check):
+    """Run a check on a worker thread and return the log records it produced"""
+    _check_buffer.records = []
+    try:
+        check()
+    except Exception as e:
+        logger.error(f"{check.__name__} failed: {e}")
+    finally:
+        records = _check_buffer.records
+        _check_buffer.records = None
+    return records
+
+def run_checks_in_parallel(checks, max_workers=4):
+    """Run independent read-only checks concurrently, emitting their output in the given order"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_buffered_check, check) for check in checks]
+        for future in futures:
+            for record in future.result():
+                logger.handle(record)
 
 def main():
     """Run all diagnostic tests"""
+    parser = argparse.ArgumentParser(description="Pygame display diagnostic for Raspberry Pi")
+    parser.add_argument('--no-driver-test', action='store_true',
+                        help="skip the pygame driver tests (pygame/SDL is never loaded)")
+    args = parser.parse_args()
+    
     logger.info("Starting Pygame Display Diagnostic")
     logger.info("=" * 50)
     
-    check_system_info()
-    check_sdl2_info()
-    check_kernel_modules()
-    test_environment_vars()
-    test_pygame_drivers()
+    # These only read system state; the driver tests mutate os.environ and stay serial
+    run_checks_in_parallel([
+        check_system_info,
+        check_boot_config,
+        check_sdl2_info,
+        check_kernel_modules,
+        test_environment_vars,
+    ])
+    if args.no_driver_test:
+        logger.info("Skipping pygame driver tests (--no-driver-test)")
+    else:
+        test_pygame_drivers()
     
     logger.info("=" * 50)
     logger.info("Diagnostic complete")